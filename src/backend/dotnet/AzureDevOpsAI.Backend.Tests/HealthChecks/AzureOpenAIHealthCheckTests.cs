@@ -0,0 +1,104 @@
+using AzureDevOpsAI.Backend.Configuration;
+using AzureDevOpsAI.Backend.HealthChecks;
+using FluentAssertions;
+using Microsoft.Extensions.Diagnostics.HealthChecks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using Microsoft.SemanticKernel;
+using Microsoft.SemanticKernel.ChatCompletion;
+using Moq;
+
+namespace AzureDevOpsAI.Backend.Tests.HealthChecks;
+
+public class AzureOpenAIHealthCheckTests
+{
+    /// <summary>
+    /// Health check whose probe returns a fixed response instead of calling Azure OpenAI.
+    /// </summary>
+    private sealed class StubProbeHealthCheck : AzureOpenAIHealthCheck
+    {
+        private readonly ChatMessageContent? _response;
+
+        public StubProbeHealthCheck(AzureOpenAISettings settings, ChatMessageContent? response)
+            : base(Options.Create(settings), new Mock<ILogger<AzureOpenAIHealthCheck>>().Object)
+        {
+            _response = response;
+        }
+
+        public int ProbeCount { get; private set; }
+
+        protected override Task<ChatMessageContent?> SendProbeAsync(CancellationToken cancellationToken)
+        {
+            ProbeCount++;
+            return Task.FromResult(_response);
+        }
+    }
+
+    private static AzureOpenAISettings CreateSettings(string endpoint)
+    {
+        return new AzureOpenAISettings
+        {
+            Endpoint = endpoint,
+            ApiKey = "test-key",
+            ChatDeploymentName = "gpt-4",
+            UseManagedIdentity = false,
+            ClientId = "test-client-id"
+        };
+    }
+
+    private static ChatMessageContent CreateResponse()
+    {
+        return new ChatMessageContent(AuthorRole.Assistant, "pong");
+    }
+
+    [Fact]
+    public async Task CheckHealthAsync_ShouldReuseHealthyResult_ForSameConfiguration()
+    {
+        // Arrange
+        var settings = CreateSettings($"https://{Guid.NewGuid():N}.openai.azure.com/");
+        var healthCheck = new StubProbeHealthCheck(settings, CreateResponse());
+
+        // Act
+        var first = await healthCheck.CheckHealthAsync(new HealthCheckContext());
+        var second = await healthCheck.CheckHealthAsync(new HealthCheckContext());
+
+        // Assert
+        first.Status.Should().Be(HealthStatus.Healthy);
+        second.Status.Should().Be(HealthStatus.Healthy);
+        healthCheck.ProbeCount.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task CheckHealthAsync_ShouldReportUnconfiguredInstanceUnhealthy_AfterHealthyProbe()
+    {
+        // Arrange
+        var healthyCheck = new StubProbeHealthCheck(CreateSettings($"https://{Guid.NewGuid():N}.openai.azure.com/"), CreateResponse());
+        var unconfiguredCheck = new StubProbeHealthCheck(CreateSettings(string.Empty), CreateResponse());
+
+        // Act
+        var healthy = await healthyCheck.CheckHealthAsync(new HealthCheckContext());
+        var unconfigured = await unconfiguredCheck.CheckHealthAsync(new HealthCheckContext());
+
+        // Assert
+        healthy.Status.Should().Be(HealthStatus.Healthy);
+        unconfigured.Status.Should().Be(HealthStatus.Unhealthy);
+        unconfigured.Description.Should().Be("Azure OpenAI endpoint is not configured");
+        unconfiguredCheck.ProbeCount.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task CheckHealthAsync_ShouldNotShareHealthyResult_AcrossEndpoints()
+    {
+        // Arrange
+        var healthyCheck = new StubProbeHealthCheck(CreateSettings($"https://{Guid.NewGuid():N}.openai.azure.com/"), CreateResponse());
+        var otherCheck = new StubProbeHealthCheck(CreateSettings($"https://{Guid.NewGuid():N}.openai.azure.com/"), null);
+
+        // Act
+        await healthyCheck.CheckHealthAsync(new HealthCheckContext());
+        var other = await otherCheck.CheckHealthAsync(new HealthCheckContext());
+
+        // Assert
+        other.Status.Should().Be(HealthStatus.Degraded);
+        otherCheck.ProbeCount.Should().Be(1);
+    }
+}
@@ -17,13 +17,10 @@ namespace AzureDevOpsAI.Backend.Tests.Middleware;
 public class ErrorHandlingMiddlewareMfaTests
 {
     private readonly Mock<ILogger<ErrorHandlingMiddleware>> _logger;
-    private readonly ErrorHandlingMiddleware _middleware;
 
     public ErrorHandlingMiddlewareMfaTests()
     {
         _logger = new Mock<ILogger<ErrorHandlingMiddleware>>();
-        var next = new Mock<RequestDelegate>();
-        _middleware = new ErrorHandlingMiddleware(next.Object, _logger.Object);
     }
 
     [Fact]
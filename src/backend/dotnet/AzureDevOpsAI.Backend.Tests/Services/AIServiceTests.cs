@@ -1,4 +1,5 @@
 using AzureDevOpsAI.Backend.Configuration;
+using AzureDevOpsAI.Backend.Models;
 using AzureDevOpsAI.Backend.Services;
 using FluentAssertions;
 using Microsoft.Extensions.Logging;
@@ -6,6 +7,8 @@ using Microsoft.Extensions.Options;
 using Microsoft.Extensions.DependencyInjection;
 using Moq;
 using Azure.Core;
+using Microsoft.SemanticKernel;
+using Microsoft.SemanticKernel.ChatCompletion;
 
 namespace AzureDevOpsAI.Backend.Tests.Services;
 
@@ -32,6 +35,19 @@ public class AIServiceTests
 
         return (mockOptions, mockLogger, mockHttpClientFactory, mockLoggerFactory, mockAzureDevOpsApiService, mockCosmosDbService);
     }
+
+    private static ChatHistory CreateConversation(int turns)
+    {
+        var chatHistory = new ChatHistory();
+        chatHistory.AddSystemMessage("system prompt");
+        for (var i = 1; i <= turns; i++)
+        {
+            chatHistory.AddUserMessage($"question {i}");
+            chatHistory.AddAssistantMessage($"answer {i}");
+        }
+        return chatHistory;
+    }
+
     [Fact]
     public void Constructor_ShouldLoadSystemPrompt_WhenInitialized()
     {
@@ -117,6 +133,180 @@ public class AIServiceTests
         service.Should().BeAssignableTo<IAIService>();
     }
 
+    [Fact]
+    public async Task ProcessChatMessageAsync_ShouldRejectConversation_OwnedByAnotherUser()
+    {
+        // Arrange
+        var azureOpenAISettings = new AzureOpenAISettings
+        {
+            Endpoint = "https://test.openai.azure.com/",
+            ApiKey = "test-key",
+            ChatDeploymentName = "gpt-4",
+            UseManagedIdentity = false,
+            ClientId = "test-client-id"
+        };
+
+        var (mockOptions, mockLogger, mockHttpClientFactory, mockLoggerFactory, mockAzureDevOpsApiService, mockCosmosDbService) = CreateMocks(azureOpenAISettings);
+        mockCosmosDbService
+            .Setup(x => x.GetChatHistoryAsync("conversation-1", It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new ChatHistoryDocument
+            {
+                Id = "conversation-1",
+                ConversationId = "conversation-1",
+                UserId = "owner-user"
+            });
+
+        var service = new AIService(mockOptions.Object, mockLogger.Object, mockHttpClientFactory.Object, mockLoggerFactory.Object, mockAzureDevOpsApiService.Object, mockCosmosDbService.Object);
+
+        // Act
+        var act = () => service.ProcessChatMessageAsync("Hello", "conversation-1", "other-user");
+
+        // Assert
+        await act.Should().ThrowAsync<UnauthorizedAccessException>();
+        mockCosmosDbService.Verify(
+            x => x.SaveChatHistoryAsync(It.IsAny<ChatHistoryDocument>(), It.IsAny<CancellationToken>()),
+            Times.Never);
+        mockCosmosDbService.Verify(
+            x => x.SaveThoughtProcessAsync(It.IsAny<ThoughtProcessDocument>(), It.IsAny<CancellationToken>()),
+            Times.Never);
+    }
+
+    [Fact]
+    public async Task GetChatHistoryAsync_ShouldRejectConversation_OwnedByAnotherUser()
+    {
+        // Arrange
+        var azureOpenAISettings = new AzureOpenAISettings
+        {
+            Endpoint = "https://test.openai.azure.com/",
+            ApiKey = "test-key",
+            ChatDeploymentName = "gpt-4",
+            UseManagedIdentity = false,
+            ClientId = "test-client-id"
+        };
+
+        var (mockOptions, mockLogger, mockHttpClientFactory, mockLoggerFactory, mockAzureDevOpsApiService, mockCosmosDbService) = CreateMocks(azureOpenAISettings);
+        mockCosmosDbService
+            .Setup(x => x.GetChatHistoryAsync("conversation-1", It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new ChatHistoryDocument
+            {
+                Id = "conversation-1",
+                ConversationId = "conversation-1",
+                UserId = "owner-user"
+            });
+
+        var service = new AIService(mockOptions.Object, mockLogger.Object, mockHttpClientFactory.Object, mockLoggerFactory.Object, mockAzureDevOpsApiService.Object, mockCosmosDbService.Object);
+
+        // Act
+        var act = () => service.GetChatHistoryAsync("conversation-1", "other-user");
+
+        // Assert
+        await act.Should().ThrowAsync<UnauthorizedAccessException>();
+    }
+
+    [Fact]
+    public async Task GetThoughtProcessAsync_ShouldRejectConversation_OwnedByAnotherUser()
+    {
+        // Arrange
+        var azureOpenAISettings = new AzureOpenAISettings
+        {
+            Endpoint = "https://test.openai.azure.com/",
+            ApiKey = "test-key",
+            ChatDeploymentName = "gpt-4",
+            UseManagedIdentity = false,
+            ClientId = "test-client-id"
+        };
+
+        var (mockOptions, mockLogger, mockHttpClientFactory, mockLoggerFactory, mockAzureDevOpsApiService, mockCosmosDbService) = CreateMocks(azureOpenAISettings);
+        mockCosmosDbService
+            .Setup(x => x.GetChatHistoryAsync("conversation-1", It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new ChatHistoryDocument
+            {
+                Id = "conversation-1",
+                ConversationId = "conversation-1",
+                UserId = "owner-user"
+            });
+
+        var service = new AIService(mockOptions.Object, mockLogger.Object, mockHttpClientFactory.Object, mockLoggerFactory.Object, mockAzureDevOpsApiService.Object, mockCosmosDbService.Object);
+
+        // Act
+        var act = () => service.GetThoughtProcessAsync("thought-1", "conversation-1", "other-user");
+
+        // Assert
+        await act.Should().ThrowAsync<UnauthorizedAccessException>();
+        mockCosmosDbService.Verify(
+            x => x.GetThoughtProcessAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<CancellationToken>()),
+            Times.Never);
+    }
+
+    [Fact]
+    public async Task SaveChatHistoryAsync_ShouldKeepLegacyConversationShared()
+    {
+        // Arrange
+        var azureOpenAISettings = new AzureOpenAISettings
+        {
+            Endpoint = "https://test.openai.azure.com/",
+            ApiKey = "test-key",
+            ChatDeploymentName = "gpt-4",
+            UseManagedIdentity = false,
+            ClientId = "test-client-id"
+        };
+
+        var (mockOptions, mockLogger, mockHttpClientFactory, mockLoggerFactory, mockAzureDevOpsApiService, mockCosmosDbService) = CreateMocks(azureOpenAISettings);
+        ChatHistoryDocument storedDocument = new()
+        {
+            Id = "legacy-conversation",
+            ConversationId = "legacy-conversation",
+            UserId = null
+        };
+        mockCosmosDbService
+            .Setup(x => x.GetChatHistoryAsync("legacy-conversation", It.IsAny<CancellationToken>()))
+            .ReturnsAsync(() => storedDocument);
+        mockCosmosDbService
+            .Setup(x => x.SaveChatHistoryAsync(It.IsAny<ChatHistoryDocument>(), It.IsAny<CancellationToken>()))
+            .Callback<ChatHistoryDocument, CancellationToken>((document, _) => storedDocument = document)
+            .Returns(Task.CompletedTask);
+
+        var service = new AIService(mockOptions.Object, mockLogger.Object, mockHttpClientFactory.Object, mockLoggerFactory.Object, mockAzureDevOpsApiService.Object, mockCosmosDbService.Object);
+
+        // Act - the first user to write to the legacy conversation saves it
+        var (chatHistory, _, ownerId, contextSummary, summarizedMessageCount) = await service.GetOrCreateChatHistoryAsync("legacy-conversation", "first-user");
+        chatHistory.AddUserMessage("Hello");
+        await service.SaveChatHistoryAsync("legacy-conversation", ownerId, chatHistory, contextSummary, summarizedMessageCount);
+
+        // Assert - the conversation is not claimed, so another user can still continue it
+        storedDocument.UserId.Should().BeNull();
+        var act = () => service.GetOrCreateChatHistoryAsync("legacy-conversation", "second-user");
+        await act.Should().NotThrowAsync();
+    }
+
+    [Fact]
+    public async Task GetOrCreateChatHistoryAsync_ShouldAssignRequestingUser_ForNewConversation()
+    {
+        // Arrange
+        var azureOpenAISettings = new AzureOpenAISettings
+        {
+            Endpoint = "https://test.openai.azure.com/",
+            ApiKey = "test-key",
+            ChatDeploymentName = "gpt-4",
+            UseManagedIdentity = false,
+            ClientId = "test-client-id"
+        };
+
+        var (mockOptions, mockLogger, mockHttpClientFactory, mockLoggerFactory, mockAzureDevOpsApiService, mockCosmosDbService) = CreateMocks(azureOpenAISettings);
+        mockCosmosDbService
+            .Setup(x => x.GetChatHistoryAsync(It.IsAny<string>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync((ChatHistoryDocument?)null);
+
+        var service = new AIService(mockOptions.Object, mockLogger.Object, mockHttpClientFactory.Object, mockLoggerFactory.Object, mockAzureDevOpsApiService.Object, mockCosmosDbService.Object);
+
+        // Act
+        var (_, isExisting, ownerId, _, _) = await service.GetOrCreateChatHistoryAsync("new-conversation", "first-user");
+
+        // Assert
+        isExisting.Should().BeFalse();
+        ownerId.Should().Be("first-user");
+    }
+
     [Fact]
     public void SystemPrompt_ShouldContainFunctionCallingGuidance()
     {
@@ -252,4 +442,100 @@ public class AIServiceTests
         // - Total tokens (TotalTokenCount)
         // - Rate limit information if available in response metadata
     }
+
+    [Fact]
+    public void BuildModelInput_ShouldSendStoredSummaryAndUncoveredMessages()
+    {
+        // Arrange - the summary covers the system prompt and the first two turns
+        var chatHistory = CreateConversation(3);
+
+        // Act
+        var modelInput = AIService.BuildModelInput(chatHistory, "summary of turns 1-2", 5);
+
+        // Assert
+        modelInput.Select(m => m.Content).Should().Equal(
+            "system prompt",
+            "summary of turns 1-2",
+            "question 3",
+            "answer 3");
+        modelInput[0].Role.Should().Be(AuthorRole.System);
+        modelInput[1].Role.Should().Be(AuthorRole.Assistant);
+    }
+
+    [Fact]
+    public void BuildModelInput_ShouldReturnHistoryUnchanged_WhenNoSummaryIsStored()
+    {
+        // Arrange
+        var chatHistory = CreateConversation(3);
+
+        // Act
+        var modelInput = AIService.BuildModelInput(chatHistory, null, 0);
+
+        // Assert
+        modelInput.Should().BeSameAs(chatHistory);
+        modelInput.Should().HaveCount(7);
+    }
+
+    [Fact]
+    public void FindSummary_ShouldCountFullHistoryMessagesCoveredBySummary()
+    {
+        // Arrange - the reducer kept the system prompt, a summary and the last turn
+        var chatHistory = CreateConversation(4);
+        var reducedHistory = new ChatHistory();
+        reducedHistory.Add(chatHistory[0]);
+        reducedHistory.Add(new ChatMessageContent(AuthorRole.Assistant, "summary of turns 1-3")
+        {
+            Metadata = new Dictionary<string, object?> { [ChatHistorySummarizationReducer.SummaryMetadataKey] = true }
+        });
+        reducedHistory.Add(chatHistory[7]);
+        reducedHistory.Add(chatHistory[8]);
+
+        // Act
+        var summary = AIService.FindSummary(chatHistory, reducedHistory);
+
+        // Assert - the system prompt and the first three turns are covered
+        summary.Should().NotBeNull();
+        summary!.Value.ContextSummary.Should().Be("summary of turns 1-3");
+        summary.Value.SummarizedMessageCount.Should().Be(7);
+
+        // The next model input is rebuilt from the summary and the uncovered tail
+        AIService.BuildModelInput(chatHistory, summary.Value.ContextSummary, summary.Value.SummarizedMessageCount)
+            .Select(m => m.Content)
+            .Should().Equal(reducedHistory.Select(m => m.Content));
+    }
+
+    [Fact]
+    public void FindSummary_ShouldFoldEverySummary_WhenReducerKeepsMultipleSummaries()
+    {
+        // Arrange - with UseSingleSummary disabled the reducer keeps the earlier summary too
+        var chatHistory = CreateConversation(4);
+        var summaryMetadata = new Dictionary<string, object?> { [ChatHistorySummarizationReducer.SummaryMetadataKey] = true };
+        var reducedHistory = new ChatHistory();
+        reducedHistory.Add(chatHistory[0]);
+        reducedHistory.Add(new ChatMessageContent(AuthorRole.Assistant, "summary of turn 1") { Metadata = summaryMetadata });
+        reducedHistory.Add(new ChatMessageContent(AuthorRole.Assistant, "summary of turns 2-3") { Metadata = summaryMetadata });
+        reducedHistory.Add(chatHistory[7]);
+        reducedHistory.Add(chatHistory[8]);
+
+        // Act
+        var summary = AIService.FindSummary(chatHistory, reducedHistory);
+
+        // Assert - no summary is dropped, and the count still ends at the last summary
+        summary.Should().NotBeNull();
+        summary!.Value.ContextSummary.Should().Be("summary of turn 1\n\nsummary of turns 2-3");
+        summary.Value.SummarizedMessageCount.Should().Be(7);
+    }
+
+    [Fact]
+    public void FindSummary_ShouldReturnNull_WhenReducedHistoryHasNoSummary()
+    {
+        // Arrange
+        var chatHistory = CreateConversation(2);
+
+        // Act
+        var summary = AIService.FindSummary(chatHistory, chatHistory);
+
+        // Assert
+        summary.Should().BeNull();
+    }
 }
\ No newline at end of file
@@ -15,6 +15,16 @@ public static class AIServicesExtensions
     public static IServiceCollection AddAIServices(this IServiceCollection services)
     {
         services.AddHttpClient();
+
+        // Share one pooled handler for Azure OpenAI calls across the per-request AIService instances
+        services.AddHttpClient(AIService.HttpClientName)
+            .ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+            {
+                PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+                PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2)
+            })
+            .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
+
         services.AddScoped<IAIService, AIService>();
 
         return services;
@@ -1,3 +1,5 @@
+using Microsoft.ApplicationInsights;
+
 namespace AzureDevOpsAI.Backend.Configuration;
 
 /// <summary>
@@ -30,4 +32,23 @@ public static class ApplicationInsightsExtensions
 
         return services;
     }
+
+    /// <summary>
+    /// Flushes buffered Application Insights telemetry when the application stops, so the
+    /// requests, exceptions and logs leading up to a shutdown aren't lost in the in-memory buffer.
+    /// </summary>
+    /// <param name="app">The web application.</param>
+    /// <returns>The web application for method chaining.</returns>
+    public static WebApplication FlushApplicationInsightsOnShutdown(this WebApplication app)
+    {
+        var telemetryClient = app.Services.GetService<TelemetryClient>();
+        if (telemetryClient != null)
+        {
+            // Bound the wait so an unreachable ingestion endpoint can't stall shutdown
+            app.Lifetime.ApplicationStopped.Register(() =>
+                telemetryClient.FlushAsync(CancellationToken.None).Wait(TimeSpan.FromSeconds(5)));
+        }
+
+        return app;
+    }
 }
@@ -21,9 +21,22 @@ public static class AzureDevOpsExtensions
         // Read Azure DevOps authentication settings
         var azureDevOpsSettings = configuration.GetSection("AzureDevOps").Get<AzureDevOpsSettings>() ?? new AzureDevOpsSettings();
 
+        // Keep one long-lived handler so pooled keep-alive connections to Azure DevOps are reused
+        // across requests; PooledConnectionLifetime still recycles them to pick up DNS changes.
+        // Requests negotiate HTTP/2, and extra HTTP/2 connections are opened only once the
+        // server's concurrent stream limit is reached
+        services.AddHttpClient(AzureDevOpsApiService.HttpClientName)
+            .ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+            {
+                PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+                PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+                EnableMultipleHttp2Connections = true
+            })
+            .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
+
         services.AddScoped<IAzureDevOpsApiService>(sp =>
         {
-            var httpClient = sp.GetRequiredService<IHttpClientFactory>().CreateClient();
+            var httpClient = sp.GetRequiredService<IHttpClientFactory>().CreateClient(AzureDevOpsApiService.HttpClientName);
             var logger = sp.GetRequiredService<ILogger<AzureDevOpsApiService>>();
             return new AzureDevOpsApiService(httpClient, logger, managedIdentityClientIdForDevOps, azureDevOpsSettings.Pat, azureDevOpsSettings.UsePat);
         });
@@ -1,4 +1,6 @@
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Logging.Console;
+using Microsoft.Extensions.Logging.Debug;
 
 namespace AzureDevOpsAI.Backend.Configuration;
 
@@ -15,7 +17,13 @@ public static class LoggingExtensions
     public static WebApplicationBuilder AddLogging(this WebApplicationBuilder builder)
     {
         // Configure logging - DON'T clear providers to keep Application Insights logger
-        builder.Logging.AddConsole();
+        // Console output is written by a background queue; never block request threads
+        // waiting on that queue when it fills up under heavy trace logging
+        builder.Logging.AddConsole(options =>
+        {
+            options.MaxQueueLength = 10_000;
+            options.QueueFullMode = ConsoleLoggerQueueFullMode.DropWrite;
+        });
         builder.Logging.AddDebug();
 
         // Ensure all trace levels are captured
@@ -26,6 +34,14 @@ public static class LoggingExtensions
         builder.Logging.AddFilter("System", LogLevel.Warning);
         builder.Logging.AddFilter("AzureDevOpsAI", LogLevel.Trace);
 
+        // The debug provider writes synchronously on the calling thread and only has a listener
+        // when a debugger is attached, so outside development it's filtered out entirely and
+        // loggers skip it instead of checking it on every call
+        if (!builder.Environment.IsDevelopment())
+        {
+            builder.Logging.AddFilter<DebugLoggerProvider>(null, LogLevel.None);
+        }
+
         return builder;
     }
 }
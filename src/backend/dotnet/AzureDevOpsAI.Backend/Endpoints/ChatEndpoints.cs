@@ -1,10 +1,13 @@
 using Microsoft.AspNetCore.Authorization;
+using Microsoft.AspNetCore.Http.Features;
 using Microsoft.AspNetCore.Mvc;
 using AzureDevOpsAI.Backend.Models;
 using AzureDevOpsAI.Backend.Configuration;
 using AzureDevOpsAI.Backend.Middleware;
 using AzureDevOpsAI.Backend.Services;
 using Microsoft.Extensions.Options;
+using System.Security.Claims;
+using System.Text.Json;
 
 namespace AzureDevOpsAI.Backend.Endpoints;
 
@@ -29,7 +32,16 @@ public static class ChatEndpoints
             .WithSummary("Send a chat message")
             .Produces<ChatResponse>(StatusCodes.Status200OK)
             .Produces<ErrorResponse>(StatusCodes.Status400BadRequest)
-            .Produces<ErrorResponse>(StatusCodes.Status401Unauthorized);
+            .Produces<ErrorResponse>(StatusCodes.Status401Unauthorized)
+            .Produces<ErrorResponse>(StatusCodes.Status403Forbidden);
+
+        chatGroup.MapPost("/message/stream", StreamMessageAsync)
+            .WithName("StreamMessage")
+            .WithSummary("Send a chat message and stream the response as server-sent events")
+            .Produces(StatusCodes.Status200OK, contentType: "text/event-stream")
+            .Produces<ErrorResponse>(StatusCodes.Status400BadRequest)
+            .Produces<ErrorResponse>(StatusCodes.Status401Unauthorized)
+            .Produces<ErrorResponse>(StatusCodes.Status403Forbidden);
 
         chatGroup.MapGet("/conversations", GetConversationsAsync)
             .WithName("GetConversations")
@@ -87,13 +99,18 @@ public static class ChatEndpoints
             // Process message using AI service (which uses managed identity for Azure DevOps API access)
             var response = await aiService.ProcessChatMessageAsync(
                 request.Message,
-                request.ConversationId);
+                request.ConversationId,
+                userId);
 
             logger.LogInformation("Successfully processed chat message for user {UserId}, conversation {ConversationId}",
                 userId, response.ConversationId);
 
             return Results.Ok(response);
         }
+        catch (UnauthorizedAccessException)
+        {
+            return ConversationForbidden();
+        }
         catch (Exception ex)
         {
             var logger = context.RequestServices.GetRequiredService<ILoggerFactory>().CreateLogger("ChatEndpoints");
@@ -103,6 +120,114 @@ public static class ChatEndpoints
         }
     }
 
+    /// <summary>
+    /// Send a chat message and stream the response as server-sent events.
+    /// Emits a "chunk" event per piece of response text, then a "done" event with the complete response.
+    /// </summary>
+    private static async Task<IResult> StreamMessageAsync(
+        [FromBody] ChatRequest request,
+        HttpContext context,
+        IOptions<SecuritySettings> securitySettings,
+        IOptions<Microsoft.AspNetCore.Http.Json.JsonOptions> jsonOptions,
+        IAIService aiService)
+    {
+        var logger = context.RequestServices.GetRequiredService<ILoggerFactory>().CreateLogger("ChatEndpoints");
+        var serializerOptions = jsonOptions.Value.SerializerOptions;
+        var cancellationToken = context.RequestAborted;
+
+        // Validate request
+        if (string.IsNullOrWhiteSpace(request.Message))
+        {
+            return Results.BadRequest(new ErrorResponse
+            {
+                Error = new ErrorDetails
+                {
+                    Code = 400,
+                    Message = "Message is required",
+                    Type = "validation_error"
+                }
+            });
+        }
+
+        try
+        {
+            var userId = GetCurrentUserId(context, securitySettings.Value);
+
+            logger.LogInformation("Streaming chat message for user {UserId}", userId);
+
+            context.Response.ContentType = "text/event-stream";
+            context.Response.Headers.CacheControl = "no-cache";
+
+            // Deliver each event as it is written: turn off server-side response buffering and
+            // ask reverse proxies (nginx-style ingress) not to buffer the stream either
+            context.Response.Headers["X-Accel-Buffering"] = "no";
+            context.Features.Get<IHttpResponseBodyFeature>()?.DisableBuffering();
+
+            var response = await aiService.StreamChatMessageAsync(
+                request.Message,
+                request.ConversationId,
+                userId,
+                chunk => WriteServerSentEventAsync(context.Response, "chunk", JsonSerializer.Serialize(chunk, serializerOptions), cancellationToken),
+                cancellationToken);
+
+            await WriteServerSentEventAsync(context.Response, "done", JsonSerializer.Serialize(response, serializerOptions), cancellationToken);
+
+            logger.LogInformation("Successfully streamed chat message for user {UserId}, conversation {ConversationId}",
+                userId, response.ConversationId);
+
+            return Results.Empty;
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            logger.LogInformation("Client disconnected while streaming chat message");
+            return Results.Empty;
+        }
+        catch (UnauthorizedAccessException) when (!context.Response.HasStarted)
+        {
+            // Ownership is checked before any content is generated, so the status can still be set
+            return ConversationForbidden();
+        }
+        catch (Exception ex)
+        {
+            logger.LogError(ex, "Error streaming chat message");
+
+            const string errorMessage = "An error occurred while processing the chat message. Please try again later.";
+            if (!context.Response.HasStarted)
+            {
+                return Results.Problem(errorMessage);
+            }
+
+            // Headers are already sent, so report the failure in-band
+            await WriteServerSentEventAsync(context.Response, "error", JsonSerializer.Serialize(errorMessage, serializerOptions), CancellationToken.None);
+            return Results.Empty;
+        }
+    }
+
+    /// <summary>
+    /// Response for a request that tries to read or continue another user's conversation.
+    /// </summary>
+    private static IResult ConversationForbidden()
+    {
+        return Results.Json(new ErrorResponse
+        {
+            Error = new ErrorDetails
+            {
+                Code = StatusCodes.Status403Forbidden,
+                Message = "Conversation belongs to another user",
+                Type = "authorization_error"
+            }
+        }, statusCode: StatusCodes.Status403Forbidden);
+    }
+
+    /// <summary>
+    /// Write a single server-sent event and flush it to the client.
+    /// </summary>
+    private static async Task WriteServerSentEventAsync(HttpResponse response, string eventName, string data, CancellationToken cancellationToken)
+    {
+        await response.WriteAsync($"event: {eventName}\ndata: {data}\n\n", cancellationToken);
+        await response.Body.FlushAsync(cancellationToken);
+    }
+
     /// <summary>
     /// Get user conversations.
     /// </summary>
@@ -195,10 +320,14 @@ public static class ChatEndpoints
             logger.LogInformation("Getting thought process {ThoughtProcessId} for conversation {ConversationId}, user {UserId}",
                 thoughtProcessId, conversationId, userId);
 
-            var thoughtProcess = await aiService.GetThoughtProcessAsync(thoughtProcessId, conversationId);
+            var thoughtProcess = await aiService.GetThoughtProcessAsync(thoughtProcessId, conversationId, userId);
 
             return Results.Ok(thoughtProcess);
         }
+        catch (UnauthorizedAccessException)
+        {
+            return ConversationForbidden();
+        }
         catch (KeyNotFoundException)
         {
             return Results.NotFound(new ErrorResponse
@@ -232,6 +361,18 @@ public static class ChatEndpoints
         }
     }
 
+    /// <summary>
+    /// Claim types identifying the user, in order of preference. The token handler maps inbound
+    /// JWT claims by default, so "sub" and "oid" usually arrive under their long-form names.
+    /// </summary>
+    private static readonly string[] UserIdClaimTypes =
+    {
+        "sub",
+        ClaimTypes.NameIdentifier,
+        "oid",
+        "http://schemas.microsoft.com/identity/claims/objectidentifier"
+    };
+
     /// <summary>
     /// Get current user ID from context or use mock.
     /// </summary>
@@ -243,8 +384,20 @@ public static class ChatEndpoints
         }
 
         // Extract user ID from JWT claims when authentication is enabled
-        var userIdClaim = context.User?.FindFirst("sub") ?? context.User?.FindFirst("oid");
-        return userIdClaim?.Value ?? "unknown-user";
+        var user = context.User;
+        if (user != null)
+        {
+            foreach (var claimType in UserIdClaimTypes)
+            {
+                var userIdClaim = user.FindFirst(claimType);
+                if (userIdClaim != null)
+                {
+                    return userIdClaim.Value;
+                }
+            }
+        }
+
+        return "unknown-user";
     }
 
     /// <summary>
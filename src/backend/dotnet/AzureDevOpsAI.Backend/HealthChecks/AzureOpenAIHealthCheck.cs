@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using Microsoft.Extensions.Diagnostics.HealthChecks;
 using Microsoft.Extensions.Options;
 using Azure.Identity;
@@ -15,6 +16,26 @@ namespace AzureDevOpsAI.Backend.HealthChecks;
 public class AzureOpenAIHealthCheck : IHealthCheck
 {
     private const string HealthCheckMessage = "ping";
+
+    /// <summary>
+    /// Managed identity credentials shared across probes so each health check reuses a cached
+    /// token instead of waiting on a fresh identity endpoint round-trip.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, TokenCredential> SharedCredentials = new();
+
+    /// <summary>
+    /// How long a healthy result is reused. Each probe sends a billable completion request, so
+    /// polling /health and /health/ready shouldn't cost one model call per poll.
+    /// </summary>
+    private static readonly TimeSpan HealthyResultTtl = TimeSpan.FromSeconds(30);
+
+    /// <summary>
+    /// Last healthy result and when it expires, keyed by endpoint and deployment. Checks are
+    /// created per probe, so the cache outlives instances. Failures aren't cached so recovery
+    /// and new failures are both seen on the next probe.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, CachedHealthResult> HealthyResults = new();
+
     private readonly AzureOpenAISettings _settings;
     private readonly ILogger<AzureOpenAIHealthCheck> _logger;
 
@@ -26,84 +47,46 @@ public class AzureOpenAIHealthCheck : IHealthCheck
 
     public async Task<HealthCheckResult> CheckHealthAsync(HealthCheckContext context, CancellationToken cancellationToken = default)
     {
-        try
+        // Validate configuration before consulting the cache, so a misconfigured instance
+        // is never reported healthy on the strength of another configuration's probe
+        if (string.IsNullOrEmpty(_settings.Endpoint))
         {
-            // Validate configuration
-            if (string.IsNullOrEmpty(_settings.Endpoint))
-            {
-                _logger.LogError("Azure OpenAI endpoint is not configured");
-                return HealthCheckResult.Unhealthy("Azure OpenAI endpoint is not configured");
-            }
-
-            if (string.IsNullOrEmpty(_settings.ChatDeploymentName))
-            {
-                _logger.LogError("Azure OpenAI chat deployment name is not configured");
-                return HealthCheckResult.Unhealthy("Azure OpenAI chat deployment name is not configured");
-            }
-
-            // Build a minimal Semantic Kernel instance for health check
-            var kernelBuilder = Kernel.CreateBuilder();
+            _logger.LogError("Azure OpenAI endpoint is not configured");
+            return HealthCheckResult.Unhealthy("Azure OpenAI endpoint is not configured");
+        }
 
-            if (_settings.UseManagedIdentity)
-            {
-                TokenCredential credential;
-
-                if (_settings.UseUserAssignedIdentity && !string.IsNullOrEmpty(_settings.ClientId))
-                {
-                    credential = new ManagedIdentityCredential(_settings.ClientId);
-                }
-                else
-                {
-                    credential = new ManagedIdentityCredential();
-                }
-
-                kernelBuilder.AddAzureOpenAIChatCompletion(
-                    deploymentName: _settings.ChatDeploymentName,
-                    endpoint: _settings.Endpoint,
-                    credentials: credential);
-            }
-            else if (!string.IsNullOrEmpty(_settings.ApiKey))
-            {
-                kernelBuilder.AddAzureOpenAIChatCompletion(
-                    deploymentName: _settings.ChatDeploymentName,
-                    endpoint: _settings.Endpoint,
-                    apiKey: _settings.ApiKey);
-            }
-            else
-            {
-                _logger.LogError("Azure OpenAI authentication not configured. Either enable managed identity or provide an API key.");
-                return HealthCheckResult.Unhealthy("Azure OpenAI authentication not configured");
-            }
+        if (string.IsNullOrEmpty(_settings.ChatDeploymentName))
+        {
+            _logger.LogError("Azure OpenAI chat deployment name is not configured");
+            return HealthCheckResult.Unhealthy("Azure OpenAI chat deployment name is not configured");
+        }
 
-            var kernel = kernelBuilder.Build();
-            var chatCompletionService = kernel.GetRequiredService<IChatCompletionService>();
+        if (!_settings.UseManagedIdentity && string.IsNullOrEmpty(_settings.ApiKey))
+        {
+            _logger.LogError("Azure OpenAI authentication not configured. Either enable managed identity or provide an API key.");
+            return HealthCheckResult.Unhealthy("Azure OpenAI authentication not configured");
+        }
 
-            // Create a minimal chat history for health check
-            var chatHistory = new ChatHistory();
-            chatHistory.AddUserMessage(HealthCheckMessage);
+        var cacheKey = $"{_settings.Endpoint}|{_settings.ChatDeploymentName}";
+        if (HealthyResults.TryGetValue(cacheKey, out var cached) && cached.ExpiresAt > DateTime.UtcNow)
+        {
+            return cached.Result;
+        }
 
+        try
+        {
             // Set a short timeout for health check
             using var cts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
             cts.CancelAfter(TimeSpan.FromSeconds(10));
 
-            // Make a minimal test request to verify the service is responding
-            // Note: Semantic Kernel doesn't expose simpler health check endpoints,
-            // so we use a minimal chat completion with MaxTokens=1 to minimize cost
-            var executionSettings = new AzureOpenAIPromptExecutionSettings
-            {
-                MaxTokens = 1 // Minimize token usage for health check
-            };
-
-            var response = await chatCompletionService.GetChatMessageContentAsync(
-                chatHistory,
-                executionSettings,
-                kernel,
-                cts.Token);
+            var response = await SendProbeAsync(cts.Token);
 
             if (response != null)
             {
                 _logger.LogDebug("Azure OpenAI health check passed. Deployment: {DeploymentName}", _settings.ChatDeploymentName);
-                return HealthCheckResult.Healthy($"Azure OpenAI is accessible. Deployment: {_settings.ChatDeploymentName}");
+                var healthy = HealthCheckResult.Healthy($"Azure OpenAI is accessible. Deployment: {_settings.ChatDeploymentName}");
+                HealthyResults[cacheKey] = new CachedHealthResult(healthy, DateTime.UtcNow + HealthyResultTtl);
+                return healthy;
             }
 
             _logger.LogWarning("Azure OpenAI health check: Received empty response");
@@ -135,4 +118,75 @@ public class AzureOpenAIHealthCheck : IHealthCheck
             return HealthCheckResult.Unhealthy($"Azure OpenAI connection failed: {ex.Message}", ex);
         }
     }
+
+    /// <summary>
+    /// Send a minimal chat completion to the configured deployment.
+    /// </summary>
+    protected virtual async Task<ChatMessageContent?> SendProbeAsync(CancellationToken cancellationToken)
+    {
+        // Build a minimal Semantic Kernel instance for health check
+        var kernelBuilder = Kernel.CreateBuilder();
+
+        if (_settings.UseManagedIdentity)
+        {
+            TokenCredential credential;
+
+            if (_settings.UseUserAssignedIdentity && !string.IsNullOrEmpty(_settings.ClientId))
+            {
+                credential = SharedCredentials.GetOrAdd(
+                    $"user-assigned:{_settings.ClientId}",
+                    _ => new ManagedIdentityCredential(_settings.ClientId));
+            }
+            else
+            {
+                credential = SharedCredentials.GetOrAdd("system-assigned", _ => new ManagedIdentityCredential());
+            }
+
+            kernelBuilder.AddAzureOpenAIChatCompletion(
+                deploymentName: _settings.ChatDeploymentName,
+                endpoint: _settings.Endpoint,
+                credentials: credential);
+        }
+        else
+        {
+            kernelBuilder.AddAzureOpenAIChatCompletion(
+                deploymentName: _settings.ChatDeploymentName,
+                endpoint: _settings.Endpoint,
+                apiKey: _settings.ApiKey!);
+        }
+
+        var kernel = kernelBuilder.Build();
+        var chatCompletionService = kernel.GetRequiredService<IChatCompletionService>();
+
+        // Create a minimal chat history for health check
+        var chatHistory = new ChatHistory();
+        chatHistory.AddUserMessage(HealthCheckMessage);
+
+        // Make a minimal test request to verify the service is responding
+        // Note: Semantic Kernel doesn't expose simpler health check endpoints,
+        // so we use a minimal chat completion with MaxTokens=1 to minimize cost
+        var executionSettings = new AzureOpenAIPromptExecutionSettings
+        {
+            MaxTokens = 1 // Minimize token usage for health check
+        };
+
+        return await chatCompletionService.GetChatMessageContentAsync(
+            chatHistory,
+            executionSettings,
+            kernel,
+            cancellationToken);
+    }
+
+    private sealed class CachedHealthResult
+    {
+        public CachedHealthResult(HealthCheckResult result, DateTime expiresAt)
+        {
+            Result = result;
+            ExpiresAt = expiresAt;
+        }
+
+        public HealthCheckResult Result { get; }
+
+        public DateTime ExpiresAt { get; }
+    }
 }
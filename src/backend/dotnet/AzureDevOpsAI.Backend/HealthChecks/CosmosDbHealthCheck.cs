@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using Microsoft.Extensions.Diagnostics.HealthChecks;
 using Microsoft.Azure.Cosmos;
 using Microsoft.Extensions.Options;
@@ -11,6 +12,18 @@ namespace AzureDevOpsAI.Backend.HealthChecks;
 /// </summary>
 public class CosmosDbHealthCheck : IHealthCheck
 {
+    /// <summary>
+    /// Credentials shared across probes so each health check reuses a cached token instead of
+    /// waiting on a fresh identity endpoint round-trip.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, Azure.Core.TokenCredential> SharedCredentials = new();
+
+    /// <summary>
+    /// Cosmos clients shared across probes, keyed by endpoint and identity. They live for the
+    /// lifetime of the process, like the client used by <see cref="Services.CosmosDbService"/>.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, CosmosClient> SharedClients = new();
+
     private readonly CosmosDbSettings _settings;
     private readonly ILogger<CosmosDbHealthCheck> _logger;
 
@@ -31,30 +44,31 @@ public class CosmosDbHealthCheck : IHealthCheck
                 return HealthCheckResult.Unhealthy("Cosmos DB endpoint is not configured");
             }
 
-            // Create a temporary Cosmos client to test connectivity
-            var clientOptions = new CosmosClientOptions
-            {
-                RequestTimeout = TimeSpan.FromSeconds(5),
-                SerializerOptions = new CosmosSerializationOptions
-                {
-                    PropertyNamingPolicy = CosmosPropertyNamingPolicy.CamelCase
-                }
-            };
-
-            Azure.Core.TokenCredential credential;
+            var credentialKey = !_settings.UseManagedIdentity
+                ? "default"
+                : !string.IsNullOrEmpty(_settings.ClientId)
+                    ? $"user-assigned:{_settings.ClientId}"
+                    : "system-assigned";
 
-            if (_settings.UseManagedIdentity)
-            {
-                credential = !string.IsNullOrEmpty(_settings.ClientId)
+            var credential = SharedCredentials.GetOrAdd(credentialKey, _ => !_settings.UseManagedIdentity
+                ? new DefaultAzureCredential()
+                : !string.IsNullOrEmpty(_settings.ClientId)
                     ? new ManagedIdentityCredential(_settings.ClientId)
-                    : new ManagedIdentityCredential();
-            }
-            else
-            {
-                credential = new DefaultAzureCredential();
-            }
+                    : new ManagedIdentityCredential());
 
-            using var cosmosClient = new CosmosClient(_settings.Endpoint, credential, clientOptions);
+            // Reuse one Cosmos client per endpoint and identity so probes ride on its pooled
+            // connections instead of opening a new TCP and TLS session every time
+            var cosmosClient = SharedClients.GetOrAdd($"{_settings.Endpoint}|{credentialKey}", _ => new CosmosClient(
+                _settings.Endpoint,
+                credential,
+                new CosmosClientOptions
+                {
+                    RequestTimeout = TimeSpan.FromSeconds(5),
+                    SerializerOptions = new CosmosSerializationOptions
+                    {
+                        PropertyNamingPolicy = CosmosPropertyNamingPolicy.CamelCase
+                    }
+                }));
 
             // Try to read the database account to verify connectivity and authentication
             // This is sufficient to determine if the service is accessible
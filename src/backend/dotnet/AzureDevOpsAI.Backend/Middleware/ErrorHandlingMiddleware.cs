@@ -46,6 +46,14 @@ public class ErrorDetails
 /// </summary>
 public class ErrorHandlingMiddleware
 {
+    /// <summary>
+    /// Serializer options shared by every error response so their metadata cache is built once.
+    /// </summary>
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+    };
+
     private readonly RequestDelegate _next;
     private readonly ILogger<ErrorHandlingMiddleware> _logger;
 
@@ -123,11 +131,7 @@ public class ErrorHandlingMiddleware
                 break;
         }
 
-        var jsonResponse = JsonSerializer.Serialize(response, new JsonSerializerOptions
-        {
-            PropertyNamingPolicy = JsonNamingPolicy.CamelCase
-        });
-
-        await context.Response.WriteAsync(jsonResponse);
+        // Serialize straight to the response body as UTF-8 rather than through an intermediate string
+        await JsonSerializer.SerializeAsync(context.Response.Body, response, JsonOptions, context.RequestAborted);
     }
 }
\ No newline at end of file
@@ -19,6 +19,12 @@ public class ChatHistoryDocument
     [JsonPropertyName("conversationId")]
     public string ConversationId { get; set; } = string.Empty;
 
+    /// <summary>
+    /// ID of the user who owns this conversation.
+    /// </summary>
+    [JsonPropertyName("userId")]
+    public string? UserId { get; set; }
+
     /// <summary>
     /// List of chat messages in this conversation.
     /// </summary>
@@ -42,6 +48,18 @@ public class ChatHistoryDocument
     /// </summary>
     [JsonPropertyName("systemPrompt")]
     public string? SystemPrompt { get; set; }
+
+    /// <summary>
+    /// Rolling summary of earlier messages, sent to the model in place of those messages.
+    /// </summary>
+    [JsonPropertyName("contextSummary")]
+    public string? ContextSummary { get; set; }
+
+    /// <summary>
+    /// Number of leading messages (including the system prompt) covered by <see cref="ContextSummary"/>.
+    /// </summary>
+    [JsonPropertyName("summarizedMessageCount")]
+    public int SummarizedMessageCount { get; set; }
 }
 
 /// <summary>
@@ -59,7 +59,7 @@ public class SubjectQueryPlugin
             if (subjectKind != null && subjectKind.Length > 0)
             {
                 subjectQueryRequest.SubjectKind = subjectKind.ToList();
-                _logger.LogInformation("Filtering by subject kind: {SubjectKind}", string.Join(", ", subjectKind));
+                _logger.LogInformation("Filtering by subject kind: {SubjectKind}", subjectKindStr);
             }
             else
             {
@@ -108,7 +108,7 @@ public class SubjectQueryPlugin
                 subjectKind = subjectKindStr,
                 totalResults = results.Count,
                 results
-            }, new JsonSerializerOptions { WriteIndented = true });
+            });
         }
         catch (Exception ex)
         {
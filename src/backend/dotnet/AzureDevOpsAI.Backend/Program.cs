@@ -28,6 +28,9 @@ builder.Services.AddHealthCheckServices();
 // Build the application
 var app = builder.Build();
 
+// Send buffered telemetry before the process exits
+app.FlushApplicationInsightsOnShutdown();
+
 // Configure middleware pipeline
 app.UseApplicationMiddleware(builder.Configuration);
 
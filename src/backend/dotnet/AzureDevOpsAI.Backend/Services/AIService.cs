@@ -8,7 +8,9 @@ using AzureDevOpsAI.Backend.Models;
 using AzureDevOpsAI.Backend.Plugins;
 using Microsoft.Extensions.Options;
 using OpenAI.Chat;
+using System.Collections.Concurrent;
 using System.Reflection;
+using System.Text;
 
 namespace AzureDevOpsAI.Backend.Services;
 
@@ -22,26 +24,40 @@ public interface IAIService
     /// </summary>
     /// <param name="message">User message</param>
     /// <param name="conversationId">Conversation ID</param>
+    /// <param name="userId">ID of the user sending the message; conversations are only continued by their owner</param>
     /// <param name="cancellationToken">Cancellation token</param>
     /// <returns>AI response with citations</returns>
-    Task<ChatResponse> ProcessChatMessageAsync(string message, string? conversationId = null, CancellationToken cancellationToken = default);
+    Task<ChatResponse> ProcessChatMessageAsync(string message, string? conversationId = null, string? userId = null, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Process a chat message, passing response content to a callback as it is generated.
+    /// </summary>
+    /// <param name="message">User message</param>
+    /// <param name="conversationId">Conversation ID</param>
+    /// <param name="userId">ID of the user sending the message; conversations are only continued by their owner</param>
+    /// <param name="onContentChunk">Callback invoked with each chunk of response content</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <returns>Complete AI response with citations</returns>
+    Task<ChatResponse> StreamChatMessageAsync(string message, string? conversationId, string? userId, Func<string, Task> onContentChunk, CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Get chat history for a conversation.
     /// </summary>
     /// <param name="conversationId">Conversation ID</param>
+    /// <param name="userId">ID of the requesting user; conversations are only readable by their owner</param>
     /// <param name="cancellationToken">Cancellation token</param>
     /// <returns>Chat history</returns>
-    Task<ChatHistory> GetChatHistoryAsync(string conversationId, CancellationToken cancellationToken = default);
+    Task<ChatHistory> GetChatHistoryAsync(string conversationId, string? userId = null, CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Get thought process for a specific message.
     /// </summary>
     /// <param name="thoughtProcessId">Thought process ID</param>
     /// <param name="conversationId">Conversation ID (required, used as partition key in CosmosDB)</param>
+    /// <param name="userId">ID of the requesting user; conversations are only readable by their owner</param>
     /// <param name="cancellationToken">Cancellation token</param>
     /// <returns>Thought process details</returns>
-    Task<ThoughtProcess> GetThoughtProcessAsync(string thoughtProcessId, string conversationId, CancellationToken cancellationToken = default);
+    Task<ThoughtProcess> GetThoughtProcessAsync(string thoughtProcessId, string conversationId, string? userId = null, CancellationToken cancellationToken = default);
 }
 
 /// <summary>
@@ -53,13 +69,16 @@ public class AIService : IAIService
     private readonly IChatCompletionService _chatCompletionService;
     private readonly AzureOpenAISettings _azureOpenAISettings;
     private readonly ILogger<AIService> _logger;
-    private readonly IHttpClientFactory _httpClientFactory;
     private readonly ILoggerFactory _loggerFactory;
     private readonly IAzureDevOpsApiService _azureDevOpsApiService;
     private readonly ICosmosDbService _cosmosDbService;
-    private readonly string _systemPrompt;
     private readonly IChatHistoryReducer? _chatHistoryReducer;
 
+    /// <summary>
+    /// Name of the pooled <see cref="HttpClient"/> registered for Azure OpenAI calls.
+    /// </summary>
+    public const string HttpClientName = "AzureOpenAI";
+
     /// <summary>
     /// Rate limit metadata keys that may be available in Azure OpenAI response headers.
     /// </summary>
@@ -71,6 +90,68 @@ public class AIService : IAIService
         "RateLimitRemainingRequests"
     };
 
+    /// <summary>
+    /// Managed identity credentials shared across scoped instances so their token caches
+    /// survive between requests instead of being rebuilt for every chat message.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, TokenCredential> SharedCredentials = new();
+
+    /// <summary>
+    /// System prompt read from the embedded resource once per process. The service is scoped,
+    /// so loading it in the constructor would block every request on a synchronous read.
+    /// </summary>
+    private static readonly Lazy<string> SystemPrompt = new(LoadSystemPrompt);
+
+    /// <summary>
+    /// Stored role labels mapped to the shared <see cref="AuthorRole"/> instances, matched
+    /// case-insensitively so restoring history doesn't lower-case every message's role.
+    /// </summary>
+    private static readonly Dictionary<string, AuthorRole> StoredMessageRoles = new(StringComparer.OrdinalIgnoreCase)
+    {
+        ["system"] = AuthorRole.System,
+        ["user"] = AuthorRole.User,
+        ["assistant"] = AuthorRole.Assistant
+    };
+
+    /// <summary>
+    /// Follow-up suggestion sets offered after a response, built once rather than on every message.
+    /// Each holds the three suggestions returned for its topic.
+    /// </summary>
+    private static readonly string[] PipelineSuggestions =
+    {
+        "How do I create a YAML pipeline?",
+        "What are the best practices for pipeline security?",
+        "How do I set up multi-stage pipelines?"
+    };
+
+    private static readonly string[] WorkItemSuggestions =
+    {
+        "How do I customize work item types?",
+        "What are the different work item states?",
+        "How do I set up sprint planning?"
+    };
+
+    private static readonly string[] RepositorySuggestions =
+    {
+        "How do I set up branch policies?",
+        "What are the best Git branching strategies?",
+        "How do I configure pull request templates?"
+    };
+
+    private static readonly string[] TestingSuggestions =
+    {
+        "How do I set up automated testing?",
+        "What are Azure Test Plans?",
+        "How do I integrate testing into pipelines?"
+    };
+
+    private static readonly string[] DefaultSuggestions =
+    {
+        "How do I get started with Azure DevOps?",
+        "What are Azure DevOps best practices?",
+        "How do I migrate from other tools to Azure DevOps?"
+    };
+
     public AIService(IOptions<AzureOpenAISettings> azureOpenAISettings, ILogger<AIService> logger,
         IHttpClientFactory httpClientFactory, ILoggerFactory loggerFactory,
         IAzureDevOpsApiService azureDevOpsApiService,
@@ -78,16 +159,13 @@ public class AIService : IAIService
     {
         _azureOpenAISettings = azureOpenAISettings.Value;
         _logger = logger;
-        _httpClientFactory = httpClientFactory;
         _loggerFactory = loggerFactory;
         _azureDevOpsApiService = azureDevOpsApiService;
         _cosmosDbService = cosmosDbService ?? throw new ArgumentNullException(nameof(cosmosDbService), "CosmosDB service is required.");
 
-        // Load system prompt from embedded resource
-        _systemPrompt = LoadSystemPrompt();
-
         // Initialize Semantic Kernel
         var builder = Kernel.CreateBuilder();
+        var httpClient = httpClientFactory.CreateClient(HttpClientName);
 
         if (_azureOpenAISettings.UseManagedIdentity)
         {
@@ -97,20 +175,23 @@ public class AIService : IAIService
             // Configure User Assigned Managed Identity with ClientId
             if (_azureOpenAISettings.UseUserAssignedIdentity)
             {
-                credential = new ManagedIdentityCredential(_azureOpenAISettings.ClientId);
+                credential = SharedCredentials.GetOrAdd(
+                    $"user-assigned:{_azureOpenAISettings.ClientId}",
+                    _ => new ManagedIdentityCredential(_azureOpenAISettings.ClientId));
                 _logger.LogInformation("Configured ManagedIdentityCredential with User Assigned Managed Identity client ID: {ClientId}", _azureOpenAISettings.ClientId);
             }
             else
             {
                 // Use system-assigned managed identity
-                credential = new DefaultAzureCredential();
+                credential = SharedCredentials.GetOrAdd("system-assigned", _ => new DefaultAzureCredential());
                 _logger.LogInformation("Configured ManagedIdentityCredential with System Assigned Managed Identity");
             }
 
             builder.AddAzureOpenAIChatCompletion(
                 deploymentName: _azureOpenAISettings.ChatDeploymentName,
                 endpoint: _azureOpenAISettings.Endpoint,
-                credential);
+                credential,
+                httpClient: httpClient);
         }
         else
         {
@@ -118,7 +199,8 @@ public class AIService : IAIService
             builder.AddAzureOpenAIChatCompletion(
                 deploymentName: _azureOpenAISettings.ChatDeploymentName,
                 endpoint: _azureOpenAISettings.Endpoint,
-                apiKey: _azureOpenAISettings.ApiKey!);
+                apiKey: _azureOpenAISettings.ApiKey!,
+                httpClient: httpClient);
         }
 
         _kernel = builder.Build();
@@ -205,7 +287,7 @@ public class AIService : IAIService
     /// Load system prompt from embedded resource.
     /// </summary>
     /// <returns>System prompt text</returns>
-    private string LoadSystemPrompt()
+    private static string LoadSystemPrompt()
     {
         var assembly = Assembly.GetExecutingAssembly();
         var resourceName = "AzureDevOpsAI.Backend.Resources.system-prompt.txt";
@@ -223,7 +305,24 @@ public class AIService : IAIService
     /// <summary>
     /// Process a chat message and return AI response.
     /// </summary>
-    public async Task<ChatResponse> ProcessChatMessageAsync(string message, string? conversationId = null, CancellationToken cancellationToken = default)
+    public Task<ChatResponse> ProcessChatMessageAsync(string message, string? conversationId = null, string? userId = null, CancellationToken cancellationToken = default)
+    {
+        return ProcessChatMessageCoreAsync(message, conversationId, userId, null, cancellationToken);
+    }
+
+    /// <summary>
+    /// Process a chat message, passing response content to a callback as it is generated.
+    /// </summary>
+    public Task<ChatResponse> StreamChatMessageAsync(string message, string? conversationId, string? userId, Func<string, Task> onContentChunk, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(onContentChunk);
+        return ProcessChatMessageCoreAsync(message, conversationId, userId, onContentChunk, cancellationToken);
+    }
+
+    /// <summary>
+    /// Process a chat message, streaming response content when a callback is provided.
+    /// </summary>
+    private async Task<ChatResponse> ProcessChatMessageCoreAsync(string message, string? conversationId, string? userId, Func<string, Task>? onContentChunk, CancellationToken cancellationToken)
     {
         var startTime = DateTime.UtcNow;
         var thoughtProcessId = Guid.NewGuid().ToString();
@@ -268,7 +367,7 @@ public class AIService : IAIService
             });
 
             // Get or create chat history for conversation
-            var (chatHistory, isExistingConversation) = await GetOrCreateChatHistoryAsync(conversationId, cancellationToken);
+            var (chatHistory, isExistingConversation, ownerId, contextSummary, summarizedMessageCount) = await GetOrCreateChatHistoryAsync(conversationId, userId, cancellationToken);
 
             // Diagnostic logging: Track conversation history state
             _logger.LogDebug("[ConversationContext] History lookup - ConversationId: {ConversationId}, ExistingConversation: {IsExisting}, MessageCount: {MessageCount}",
@@ -283,7 +382,7 @@ public class AIService : IAIService
                 Details = new Dictionary<string, object>
                 {
                     ["history_length"] = chatHistory.Count,
-                    ["has_system_prompt"] = !string.IsNullOrEmpty(_systemPrompt)
+                    ["has_system_prompt"] = !string.IsNullOrEmpty(SystemPrompt.Value)
                 }
             });
 
@@ -291,9 +390,14 @@ public class AIService : IAIService
             var messageCountBeforeAdd = chatHistory.Count;
             chatHistory.AddUserMessage(message);
 
-            // Diagnostic logging: Track message addition
-            _logger.LogDebug("[ConversationContext] User message added - ConversationId: {ConversationId}, MessagesBefore: {Before}, MessagesAfter: {After}, MessagePreview: {Preview}",
-                conversationId, messageCountBeforeAdd, chatHistory.Count, message.Length > 50 ? message.Substring(0, 50) + "..." : message);
+            // Diagnostic logging: Track message addition. The preview and history summary below are
+            // built eagerly, so only build them when debug logging is on
+            var isDebugEnabled = _logger.IsEnabled(LogLevel.Debug);
+            if (isDebugEnabled)
+            {
+                _logger.LogDebug("[ConversationContext] User message added - ConversationId: {ConversationId}, MessagesBefore: {Before}, MessagesAfter: {After}, MessagePreview: {Preview}",
+                    conversationId, messageCountBeforeAdd, chatHistory.Count, message.Length > 50 ? message.Substring(0, 50) + "..." : message);
+            }
 
             // Configure chat completion settings
             var executionSettings = new AzureOpenAIPromptExecutionSettings
@@ -303,7 +407,10 @@ public class AIService : IAIService
                 TopP = 1.0,
                 FrequencyPenalty = 0.0,
                 PresencePenalty = 0.0,
-                FunctionChoiceBehavior = FunctionChoiceBehavior.Auto()
+                FunctionChoiceBehavior = FunctionChoiceBehavior.Auto(),
+                // Stable per conversation so turns sharing a prompt prefix are routed to the
+                // same Azure OpenAI prompt cache instead of re-running prefill on every turn
+                User = conversationId
             };
 
             // Track reasoning step
@@ -325,15 +432,23 @@ public class AIService : IAIService
             _logger.LogInformation("Processing chat message for conversation {ConversationId}", conversationId);
 
             // Diagnostic logging: Detailed history summary before AI call
-            _logger.LogDebug("[ConversationContext] Preparing AI request - ConversationId: {ConversationId}, TotalMessages: {TotalMessages}, HistorySummary: {Summary}",
-                conversationId, chatHistory.Count, GetChatHistorySummary(chatHistory));
+            if (isDebugEnabled)
+            {
+                _logger.LogDebug("[ConversationContext] Preparing AI request - ConversationId: {ConversationId}, TotalMessages: {TotalMessages}, HistorySummary: {Summary}",
+                    conversationId, chatHistory.Count, GetChatHistorySummary(chatHistory));
+            }
 
             // Apply chat history reduction if enabled (for model input only, not storage)
             ChatHistory reducedHistory = chatHistory;
             if (_chatHistoryReducer != null)
             {
                 var originalMessageCount = chatHistory.Count;
-                var reducedMessages = await _chatHistoryReducer.ReduceAsync(chatHistory, cancellationToken);
+
+                // Start from the stored summary so only messages added since the last
+                // reduction count towards the threshold, instead of re-summarizing every turn
+                var modelInput = BuildModelInput(chatHistory, contextSummary, summarizedMessageCount);
+                reducedHistory = modelInput;
+                var reducedMessages = await _chatHistoryReducer.ReduceAsync(modelInput, cancellationToken);
 
                 if (reducedMessages != null)
                 {
@@ -344,6 +459,13 @@ public class AIService : IAIService
                         reducedHistory.Add(msg);
                     }
 
+                    // Remember the new summary and how much of the full history it covers
+                    var summary = FindSummary(chatHistory, reducedHistory);
+                    if (summary != null)
+                    {
+                        (contextSummary, summarizedMessageCount) = summary.Value;
+                    }
+
                     _logger.LogInformation("[ChatHistoryReducer] History reduced for model input - ConversationId: {ConversationId}, OriginalCount: {OriginalCount}, ReducedCount: {ReducedCount}, ReductionPercent: {ReductionPercent:F1}%",
                         conversationId, originalMessageCount, reducedHistory.Count,
                         (originalMessageCount - reducedHistory.Count) * 100.0 / originalMessageCount);
@@ -365,7 +487,7 @@ public class AIService : IAIService
                 else
                 {
                     _logger.LogDebug("[ChatHistoryReducer] No reduction needed - ConversationId: {ConversationId}, MessageCount: {MessageCount}",
-                        conversationId, chatHistory.Count);
+                        conversationId, reducedHistory.Count);
                 }
             }
 
@@ -373,28 +495,26 @@ public class AIService : IAIService
             RegisterPluginsWithUserContext();
 
             // Get AI response using the reduced history (if applicable)
-            var response = await _chatCompletionService.GetChatMessageContentAsync(
-                reducedHistory,
-                executionSettings,
-                _kernel,
-                cancellationToken);
+            var (responseContent, responseMetadata) = onContentChunk == null
+                ? await GetChatResponseAsync(reducedHistory, executionSettings, cancellationToken)
+                : await StreamChatResponseAsync(reducedHistory, executionSettings, onContentChunk, cancellationToken);
 
-            if (response == null || string.IsNullOrEmpty(response.Content))
+            if (string.IsNullOrEmpty(responseContent))
             {
                 throw new InvalidOperationException("AI service returned empty response");
             }
 
             // Log token metrics
-            LogTokenMetrics(response.Metadata, conversationId);
+            LogTokenMetrics(responseMetadata, conversationId);
 
             // Track response generation completion
             var completionDetails = new Dictionary<string, object>
             {
-                ["response_length"] = response.Content.Length
+                ["response_length"] = responseContent.Length
             };
 
             // Extract serializable token usage to avoid JSON serialization errors
-            var tokenUsage = ExtractSerializableTokenUsage(response.Metadata);
+            var tokenUsage = ExtractSerializableTokenUsage(responseMetadata);
             if (tokenUsage != null)
             {
                 completionDetails["tokens_used"] = tokenUsage;
@@ -414,11 +534,11 @@ public class AIService : IAIService
 
             // Add AI response to history
             var messageCountBeforeResponse = chatHistory.Count;
-            chatHistory.AddAssistantMessage(response.Content);
+            chatHistory.AddAssistantMessage(responseContent);
 
             // Diagnostic logging: Track AI response addition
             _logger.LogDebug("[ConversationContext] AI response added - ConversationId: {ConversationId}, MessagesBefore: {Before}, MessagesAfter: {After}, ResponseLength: {Length}",
-                conversationId, messageCountBeforeResponse, chatHistory.Count, response.Content.Length);
+                conversationId, messageCountBeforeResponse, chatHistory.Count, responseContent.Length);
 
             // Track post-processing
             thoughtProcess.Steps.Add(new ThoughtStep
@@ -433,20 +553,22 @@ public class AIService : IAIService
             thoughtProcess.EndTime = endTime;
             thoughtProcess.DurationMs = (long)(endTime - startTime).TotalMilliseconds;
 
-            // Store chat history and thought process (CosmosDB or in-memory fallback)
-            await SaveChatHistoryAsync(conversationId, chatHistory, cancellationToken);
-            await SaveThoughtProcessAsync(thoughtProcessId, thoughtProcess, conversationId, cancellationToken);
+            // Store chat history and thought process (CosmosDB or in-memory fallback). The two documents
+            // are independent, so write them concurrently rather than paying for two round trips in sequence
+            await Task.WhenAll(
+                SaveChatHistoryAsync(conversationId, ownerId, chatHistory, contextSummary, summarizedMessageCount, cancellationToken),
+                SaveThoughtProcessAsync(thoughtProcessId, thoughtProcess, conversationId, cancellationToken));
 
             // Create response object with citations
             var chatResponse = new ChatResponse
             {
-                Message = response.Content,
+                Message = responseContent,
                 ConversationId = conversationId,
                 Format = "markdown", // AI responses are formatted in markdown
                 Timestamp = endTime, // Use the end time of processing
                 ThoughtProcessId = thoughtProcessId,
-                Suggestions = GenerateSuggestions(message, response.Content),
-                Citations = GenerateCitations(message, response.Content)
+                Suggestions = GenerateSuggestions(message, responseContent),
+                Citations = GenerateCitations(message, responseContent)
             };
 
             _logger.LogInformation("Successfully processed chat message for conversation {ConversationId}", conversationId);
@@ -457,7 +579,10 @@ public class AIService : IAIService
 
             return chatResponse;
         }
-        catch (Exception ex)
+        // Rejected conversation access and caller cancellations are expected outcomes, not processing
+        // errors, so they propagate without an error log or an error thought process being saved
+        catch (Exception ex) when (ex is not UnauthorizedAccessException
+            && (ex is not OperationCanceledException || !cancellationToken.IsCancellationRequested))
         {
             _logger.LogError(ex, "Error processing chat message for conversation {ConversationId}", conversationId);
 
@@ -497,14 +622,58 @@ public class AIService : IAIService
         }
     }
 
+    /// <summary>
+    /// Get the complete chat response in a single call.
+    /// </summary>
+    private async Task<(string? Content, IReadOnlyDictionary<string, object?>? Metadata)> GetChatResponseAsync(
+        ChatHistory history, PromptExecutionSettings executionSettings, CancellationToken cancellationToken)
+    {
+        var response = await _chatCompletionService.GetChatMessageContentAsync(
+            history,
+            executionSettings,
+            _kernel,
+            cancellationToken);
+
+        return (response?.Content, response?.Metadata);
+    }
+
+    /// <summary>
+    /// Stream the chat response, forwarding each content chunk as it arrives.
+    /// </summary>
+    private async Task<(string? Content, IReadOnlyDictionary<string, object?>? Metadata)> StreamChatResponseAsync(
+        ChatHistory history, PromptExecutionSettings executionSettings, Func<string, Task> onContentChunk, CancellationToken cancellationToken)
+    {
+        var content = new StringBuilder();
+        IReadOnlyDictionary<string, object?>? metadata = null;
+
+        await foreach (var chunk in _chatCompletionService.GetStreamingChatMessageContentsAsync(
+            history,
+            executionSettings,
+            _kernel,
+            cancellationToken))
+        {
+            if (!string.IsNullOrEmpty(chunk.Content))
+            {
+                content.Append(chunk.Content);
+                await onContentChunk(chunk.Content);
+            }
+
+            metadata = chunk.Metadata ?? metadata;
+        }
+
+        return (content.ToString(), metadata);
+    }
+
     /// <summary>
     /// Get chat history for a conversation.
+    /// Throws <see cref="UnauthorizedAccessException"/> if the conversation belongs to another user.
     /// </summary>
-    public async Task<ChatHistory> GetChatHistoryAsync(string conversationId, CancellationToken cancellationToken = default)
+    public async Task<ChatHistory> GetChatHistoryAsync(string conversationId, string? userId = null, CancellationToken cancellationToken = default)
     {
         var document = await _cosmosDbService.GetChatHistoryAsync(conversationId, cancellationToken);
         if (document != null)
         {
+            EnsureConversationOwner(document, userId);
             return ConvertToChatHistory(document);
         }
         return new ChatHistory();
@@ -512,14 +681,22 @@ public class AIService : IAIService
 
     /// <summary>
     /// Get thought process for a specific message.
+    /// Throws <see cref="UnauthorizedAccessException"/> if the conversation belongs to another user.
     /// </summary>
-    public async Task<ThoughtProcess> GetThoughtProcessAsync(string thoughtProcessId, string conversationId, CancellationToken cancellationToken = default)
+    public async Task<ThoughtProcess> GetThoughtProcessAsync(string thoughtProcessId, string conversationId, string? userId = null, CancellationToken cancellationToken = default)
     {
         if (string.IsNullOrEmpty(conversationId))
         {
             throw new ArgumentException("Conversation ID cannot be null or empty", nameof(conversationId));
         }
 
+        // Thought processes are stored per conversation, so ownership is recorded on the conversation
+        var conversation = await _cosmosDbService.GetChatHistoryAsync(conversationId, cancellationToken);
+        if (conversation != null)
+        {
+            EnsureConversationOwner(conversation, userId);
+        }
+
         var document = await _cosmosDbService.GetThoughtProcessAsync(thoughtProcessId, conversationId, cancellationToken);
         if (document != null)
         {
@@ -530,37 +707,119 @@ public class AIService : IAIService
     }
 
     /// <summary>
-    /// Get or create chat history for a conversation.
+    /// Get or create chat history for a conversation, along with the owner to save it under:
+    /// the requesting user for a new conversation, otherwise the stored owner (none for legacy conversations).
+    /// Throws <see cref="UnauthorizedAccessException"/> if the conversation belongs to another user.
     /// </summary>
-    private async Task<(ChatHistory chatHistory, bool isExisting)> GetOrCreateChatHistoryAsync(string conversationId, CancellationToken cancellationToken = default)
+    internal async Task<(ChatHistory chatHistory, bool isExisting, string? ownerId, string? contextSummary, int summarizedMessageCount)> GetOrCreateChatHistoryAsync(string conversationId, string? userId, CancellationToken cancellationToken = default)
     {
         var document = await _cosmosDbService.GetChatHistoryAsync(conversationId, cancellationToken);
         if (document != null)
         {
+            EnsureConversationOwner(document, userId);
+
             var chatHistory = ConvertToChatHistory(document);
             _logger.LogDebug("[ConversationContext] Existing ChatHistory retrieved from CosmosDB - ConversationId: {ConversationId}, MessageCount: {MessageCount}",
                 conversationId, chatHistory.Count);
-            return (chatHistory, true);
+            return (chatHistory, true, document.UserId, document.ContextSummary, document.SummarizedMessageCount);
         }
         else
         {
             var chatHistory = new ChatHistory();
-            chatHistory.AddSystemMessage(_systemPrompt);
+            chatHistory.AddSystemMessage(SystemPrompt.Value);
             _logger.LogInformation("[ConversationContext] New ChatHistory created - ConversationId: {ConversationId}, SystemPromptLength: {PromptLength}",
-                conversationId, _systemPrompt.Length);
-            return (chatHistory, false);
+                conversationId, SystemPrompt.Value.Length);
+            return (chatHistory, false, userId, null, 0);
+        }
+    }
+
+    /// <summary>
+    /// Throw <see cref="UnauthorizedAccessException"/> if a stored conversation belongs to a user other than <paramref name="userId"/>.
+    /// </summary>
+    private void EnsureConversationOwner(ChatHistoryDocument document, string? userId)
+    {
+        // Conversations saved before ownership was recorded have no user ID and stay shared
+        if (!string.IsNullOrEmpty(document.UserId) && document.UserId != userId)
+        {
+            _logger.LogWarning("[ConversationContext] Conversation {ConversationId} belongs to another user, rejecting request from {UserId}",
+                document.ConversationId, userId);
+            throw new UnauthorizedAccessException($"Conversation {document.ConversationId} belongs to another user");
         }
     }
 
     /// <summary>
     /// Save chat history to CosmosDB.
     /// </summary>
-    private async Task SaveChatHistoryAsync(string conversationId, ChatHistory chatHistory, CancellationToken cancellationToken = default)
+    internal async Task SaveChatHistoryAsync(string conversationId, string? ownerId, ChatHistory chatHistory, string? contextSummary, int summarizedMessageCount, CancellationToken cancellationToken = default)
     {
         var document = ConvertToDocument(conversationId, chatHistory);
+        document.UserId = ownerId;
+        document.ContextSummary = contextSummary;
+        document.SummarizedMessageCount = summarizedMessageCount;
         await _cosmosDbService.SaveChatHistoryAsync(document, cancellationToken);
     }
 
+    /// <summary>
+    /// Build the model input from the full history: the system prompt, the stored summary
+    /// of earlier messages, then every message the summary does not cover yet.
+    /// </summary>
+    internal static ChatHistory BuildModelInput(ChatHistory chatHistory, string? contextSummary, int summarizedMessageCount)
+    {
+        if (string.IsNullOrEmpty(contextSummary) || summarizedMessageCount <= 1 || summarizedMessageCount >= chatHistory.Count)
+        {
+            return chatHistory;
+        }
+
+        var modelInput = new ChatHistory();
+        if (chatHistory[0].Role == AuthorRole.System)
+        {
+            modelInput.Add(chatHistory[0]);
+        }
+
+        modelInput.Add(new Microsoft.SemanticKernel.ChatMessageContent(AuthorRole.Assistant, contextSummary)
+        {
+            Metadata = new Dictionary<string, object?> { [ChatHistorySummarizationReducer.SummaryMetadataKey] = true }
+        });
+
+        for (var i = summarizedMessageCount; i < chatHistory.Count; i++)
+        {
+            modelInput.Add(chatHistory[i]);
+        }
+
+        return modelInput;
+    }
+
+    /// <summary>
+    /// Find the summary in a reduced model input, along with the number of leading messages of the
+    /// full history it covers: everything except the messages that follow the last summary.
+    /// With <c>UseSingleSummary</c> disabled the reducer keeps earlier summaries alongside the new one,
+    /// so every summary message is folded into the stored summary, oldest first.
+    /// Returns null if the reduced input has no summary.
+    /// </summary>
+    internal static (string? ContextSummary, int SummarizedMessageCount)? FindSummary(ChatHistory chatHistory, ChatHistory reducedHistory)
+    {
+        var summaryIndex = reducedHistory.ToList().FindLastIndex(IsSummaryMessage);
+        if (summaryIndex < 0)
+        {
+            return null;
+        }
+
+        var summary = string.Join("\n\n", reducedHistory
+            .Take(summaryIndex + 1)
+            .Where(IsSummaryMessage)
+            .Select(message => message.Content));
+
+        return (summary, chatHistory.Count - (reducedHistory.Count - summaryIndex - 1));
+    }
+
+    /// <summary>
+    /// Check whether a message is a summary produced by the chat history reducer.
+    /// </summary>
+    private static bool IsSummaryMessage(Microsoft.SemanticKernel.ChatMessageContent message)
+    {
+        return message.Metadata?.ContainsKey(ChatHistorySummarizationReducer.SummaryMetadataKey) == true;
+    }
+
     /// <summary>
     /// Save thought process to CosmosDB.
     /// </summary>
@@ -578,17 +837,9 @@ public class AIService : IAIService
         var chatHistory = new ChatHistory();
         foreach (var message in document.Messages)
         {
-            switch (message.Role.ToLowerInvariant())
-            {
-                case "system":
-                    chatHistory.AddSystemMessage(message.Content);
-                    break;
-                case "user":
-                    chatHistory.AddUserMessage(message.Content);
-                    break;
-                case "assistant":
-                    chatHistory.AddAssistantMessage(message.Content);
-                    break;
+            if (StoredMessageRoles.TryGetValue(message.Role, out var role))
+            {
+                chatHistory.AddMessage(role, message.Content);
             }
         }
         return chatHistory;
@@ -599,6 +850,8 @@ public class AIService : IAIService
     /// </summary>
     private ChatHistoryDocument ConvertToDocument(string conversationId, ChatHistory chatHistory)
     {
+        // All entries are stamped with the save time, so read the clock once
+        var savedAt = DateTime.UtcNow;
         var document = new ChatHistoryDocument
         {
             Id = conversationId,
@@ -607,7 +860,7 @@ public class AIService : IAIService
             {
                 Role = m.Role.ToString(),
                 Content = m.Content ?? string.Empty,
-                Timestamp = DateTime.UtcNow
+                Timestamp = savedAt
             }).ToList()
         };
 
@@ -814,44 +1067,34 @@ public class AIService : IAIService
     /// </summary>
     private List<string> GenerateSuggestions(string userMessage, string aiResponse)
     {
-        var suggestions = new List<string>();
-
         // Generate contextual suggestions based on keywords in the user message
         var lowerMessage = userMessage.ToLowerInvariant();
 
+        string[] suggestions;
         if (lowerMessage.Contains("pipeline") || lowerMessage.Contains("ci/cd"))
         {
-            suggestions.Add("How do I create a YAML pipeline?");
-            suggestions.Add("What are the best practices for pipeline security?");
-            suggestions.Add("How do I set up multi-stage pipelines?");
+            suggestions = PipelineSuggestions;
         }
         else if (lowerMessage.Contains("work item") || lowerMessage.Contains("backlog") || lowerMessage.Contains("board"))
         {
-            suggestions.Add("How do I customize work item types?");
-            suggestions.Add("What are the different work item states?");
-            suggestions.Add("How do I set up sprint planning?");
+            suggestions = WorkItemSuggestions;
         }
         else if (lowerMessage.Contains("repository") || lowerMessage.Contains("git") || lowerMessage.Contains("branch"))
         {
-            suggestions.Add("How do I set up branch policies?");
-            suggestions.Add("What are the best Git branching strategies?");
-            suggestions.Add("How do I configure pull request templates?");
+            suggestions = RepositorySuggestions;
         }
         else if (lowerMessage.Contains("test") || lowerMessage.Contains("testing"))
         {
-            suggestions.Add("How do I set up automated testing?");
-            suggestions.Add("What are Azure Test Plans?");
-            suggestions.Add("How do I integrate testing into pipelines?");
+            suggestions = TestingSuggestions;
         }
         else
         {
             // Default suggestions for general DevOps questions
-            suggestions.Add("How do I get started with Azure DevOps?");
-            suggestions.Add("What are Azure DevOps best practices?");
-            suggestions.Add("How do I migrate from other tools to Azure DevOps?");
+            suggestions = DefaultSuggestions;
         }
 
-        return suggestions.Take(3).ToList(); // Return top 3 suggestions
+        // Copy so the response owns its list and the shared set can't be modified
+        return new List<string>(suggestions);
     }
 
     /// <summary>
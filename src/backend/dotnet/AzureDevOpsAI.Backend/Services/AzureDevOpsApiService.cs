@@ -1,6 +1,9 @@
 using System.Diagnostics.CodeAnalysis;
 using Azure.Identity;
 using Azure.Core;
+using System.Collections.Concurrent;
+using System.Net;
+using System.Net.Http.Json;
 using System.Text.Json;
 using System.Text;
 using AzureDevOpsAI.Backend.Models;
@@ -45,11 +48,27 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
     private readonly HttpClient _httpClient;
     private readonly ILogger<AzureDevOpsApiService> _logger;
     private readonly string? _pat;
+    private readonly string? _patCredentials;
     private readonly bool _usePat;
 
+    /// <summary>
+    /// Name of the pooled <see cref="HttpClient"/> registered for Azure DevOps API calls.
+    /// </summary>
+    public const string HttpClientName = "AzureDevOps";
+
+    private const string AzureDevOpsBaseUrl = "https://dev.azure.com/";
     private const string AzureDevOpsScope = "https://app.vssps.visualstudio.com/.default";
     private const string ExpectedAudience = "499b84ac-1321-427f-aa17-267ca6975798";
 
+    // Credentials keyed by managed identity client ID. Each caches its access token until shortly
+    // before expiry, so sharing them avoids a token request on every chat turn.
+    private static readonly ConcurrentDictionary<string, TokenCredential> SharedCredentials = new();
+
+    // Expiry (UTC ticks) of the last token whose claims were decoded and logged. Credentials hand
+    // out the same cached token until it nears expiry, so decoding it again on every request adds
+    // nothing. Keyed on the expiry rather than the token so no extra copy of the credential is kept.
+    private static long _lastDiagnosedTokenExpiry;
+
     // Centralized JSON serializer options for consistent behavior
     private static readonly JsonSerializerOptions JsonOptions = new JsonSerializerOptions
     {
@@ -70,12 +89,17 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
             {
                 throw new ArgumentException("Personal Access Token cannot be null or empty when UsePat is true", nameof(pat));
             }
+            // The PAT never changes for this instance, so encode the Basic credentials once
+            _patCredentials = CreateBasicAuthHeader(_pat);
             _logger.LogInformation("AzureDevOpsApiService initialized with Personal Access Token authentication");
         }
         else
         {
-            // When not using PAT, initialize the credential (guaranteed to be non-null in this branch)
-            _credential = string.IsNullOrWhiteSpace(managedIdentityClientId) ? new DefaultAzureCredential() : new DefaultAzureCredential(new DefaultAzureCredentialOptions { ManagedIdentityClientId = managedIdentityClientId });
+            // When not using PAT, initialize the credential (guaranteed to be non-null in this branch).
+            // Shared per client ID so the credential's token cache outlives this scoped instance.
+            _credential = SharedCredentials.GetOrAdd(
+                managedIdentityClientId ?? string.Empty,
+                clientId => string.IsNullOrWhiteSpace(clientId) ? new DefaultAzureCredential() : new DefaultAzureCredential(new DefaultAzureCredentialOptions { ManagedIdentityClientId = clientId }));
 
             if (string.IsNullOrWhiteSpace(managedIdentityClientId))
             {
@@ -98,6 +122,56 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
         return Convert.ToBase64String(patBytes);
     }
 
+    /// <summary>
+    /// Creates a request that negotiates HTTP/2 so concurrent calls from plugins share one multiplexed
+    /// connection, falling back to HTTP/1.1 when the server doesn't offer it.
+    /// </summary>
+    private static HttpRequestMessage CreateRequest(HttpMethod method, string url)
+    {
+        return new HttpRequestMessage(method, url)
+        {
+            Version = HttpVersion.Version20,
+            VersionPolicy = HttpVersionPolicy.RequestVersionOrLower
+        };
+    }
+
+    /// <summary>
+    /// Sets the authorization and accept headers for an Azure DevOps API request.
+    /// </summary>
+    private async Task SetRequestHeadersAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        // Set authorization header based on authentication type
+        if (_usePat)
+        {
+            // Use Basic Authentication with PAT
+            request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Basic", _patCredentials);
+        }
+        else
+        {
+            // Acquire token using ManagedIdentityCredential (User Assigned Managed Identity)
+            // _credential is guaranteed to be non-null when _usePat is false (initialized in constructor)
+            var tokenRequestContext = new TokenRequestContext(new[] { AzureDevOpsScope });
+            var accessToken = await _credential!.GetTokenAsync(tokenRequestContext, cancellationToken);
+
+            // Log token metadata for troubleshooting (not the token itself)
+            LogTokenMetadata(accessToken);
+
+            request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", accessToken.Token);
+        }
+
+        request.Headers.Accept.Add(new System.Net.Http.Headers.MediaTypeWithQualityHeaderValue("application/json"));
+    }
+
+    /// <summary>
+    /// Wraps UTF-8 JSON bytes as request content, avoiding an intermediate string.
+    /// </summary>
+    private static ByteArrayContent CreateJsonContent(byte[] utf8Json, string mediaType)
+    {
+        var content = new ByteArrayContent(utf8Json);
+        content.Headers.ContentType = new System.Net.Http.Headers.MediaTypeHeaderValue(mediaType) { CharSet = "utf-8" };
+        return content;
+    }
+
     /// <summary>
     /// Makes an authenticated GET request to Azure DevOps API using managed identity or PAT.
     /// </summary>
@@ -109,35 +183,15 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
             _logger.LogDebug("Making GET request to Azure DevOps API: {Url}", url);
 
             // Create HttpRequestMessage with authorization header (thread-safe approach)
-            using var request = new HttpRequestMessage(HttpMethod.Get, url);
-
-            // Set authorization header based on authentication type
-            if (_usePat)
-            {
-                // Use Basic Authentication with PAT
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Basic", CreateBasicAuthHeader(_pat!));
-            }
-            else
-            {
-                // Acquire token using ManagedIdentityCredential (User Assigned Managed Identity)
-                // _credential is guaranteed to be non-null when _usePat is false (initialized in constructor)
-                var tokenRequestContext = new TokenRequestContext(new[] { AzureDevOpsScope });
-                var accessToken = await _credential!.GetTokenAsync(tokenRequestContext, cancellationToken);
-
-                // Log token metadata for troubleshooting (not the token itself)
-                LogTokenMetadata(accessToken);
+            using var request = CreateRequest(HttpMethod.Get, url);
 
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", accessToken.Token);
-            }
-
-            request.Headers.Accept.Add(new System.Net.Http.Headers.MediaTypeWithQualityHeaderValue("application/json"));
+            await SetRequestHeadersAsync(request, cancellationToken);
 
             var response = await _httpClient.SendAsync(request, cancellationToken);
 
             if (response.IsSuccessStatusCode)
             {
-                var content = await response.Content.ReadAsStringAsync(cancellationToken);
-                var result = JsonSerializer.Deserialize<T>(content, JsonOptions);
+                var result = await response.Content.ReadFromJsonAsync<T>(JsonOptions, cancellationToken);
                 _logger.LogDebug("Successfully completed GET request to Azure DevOps API: {Url}", url);
                 return result;
             }
@@ -148,7 +202,7 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
                 return null;
             }
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException || !cancellationToken.IsCancellationRequested)
         {
             _logger.LogError(ex, "Failed to make GET request to Azure DevOps API: {Organization}/{ApiPath}", organization, apiPath);
             throw;
@@ -166,44 +220,27 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
             _logger.LogDebug("Making POST request to Azure DevOps API: {Url}", url);
 
             // Create HttpRequestMessage with authorization header (thread-safe approach)
-            using var request = new HttpRequestMessage(HttpMethod.Post, url);
-
-            // Set authorization header based on authentication type
-            if (_usePat)
-            {
-                // Use Basic Authentication with PAT
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Basic", CreateBasicAuthHeader(_pat!));
-            }
-            else
-            {
-                // Acquire token using ManagedIdentityCredential (User Assigned Managed Identity)
-                // _credential is guaranteed to be non-null when _usePat is false (initialized in constructor)
-                var tokenRequestContext = new TokenRequestContext(new[] { AzureDevOpsScope });
-                var accessToken = await _credential!.GetTokenAsync(tokenRequestContext, cancellationToken);
-
-                // Log token metadata for troubleshooting (not the token itself)
-                LogTokenMetadata(accessToken);
-
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", accessToken.Token);
-            }
+            using var request = CreateRequest(HttpMethod.Post, url);
 
-            request.Headers.Accept.Add(new System.Net.Http.Headers.MediaTypeWithQualityHeaderValue("application/json"));
+            await SetRequestHeadersAsync(request, cancellationToken);
 
             if (body != null)
             {
-                var jsonBody = JsonSerializer.Serialize(body, JsonOptions);
+                var jsonBody = JsonSerializer.SerializeToUtf8Bytes(body, JsonOptions);
 
-                _logger.LogDebug("POST request body for type {Type}: {JsonBody}", typeof(T).FullName, jsonBody);
+                if (_logger.IsEnabled(LogLevel.Debug))
+                {
+                    _logger.LogDebug("POST request body for type {Type}: {JsonBody}", typeof(T).FullName, Encoding.UTF8.GetString(jsonBody));
+                }
 
-                request.Content = new StringContent(jsonBody, Encoding.UTF8, "application/json");
+                request.Content = CreateJsonContent(jsonBody, "application/json");
             }
 
             var response = await _httpClient.SendAsync(request, cancellationToken);
 
             if (response.IsSuccessStatusCode)
             {
-                var responseContent = await response.Content.ReadAsStringAsync(cancellationToken);
-                var result = JsonSerializer.Deserialize<T>(responseContent, JsonOptions);
+                var result = await response.Content.ReadFromJsonAsync<T>(JsonOptions, cancellationToken);
                 _logger.LogDebug("Successfully completed POST request to Azure DevOps API: {Url}", url);
                 return result;
             }
@@ -214,7 +251,7 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
                 return null;
             }
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException || !cancellationToken.IsCancellationRequested)
         {
             _logger.LogError(ex, "Failed to make POST request to Azure DevOps API: {Organization}/{ApiPath}", organization, apiPath);
             throw;
@@ -232,41 +269,20 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
             _logger.LogDebug("Making PUT request to Azure DevOps API: {Url}", url);
 
             // Create HttpRequestMessage with authorization header (thread-safe approach)
-            using var request = new HttpRequestMessage(HttpMethod.Put, url);
+            using var request = CreateRequest(HttpMethod.Put, url);
 
-            // Set authorization header based on authentication type
-            if (_usePat)
-            {
-                // Use Basic Authentication with PAT
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Basic", CreateBasicAuthHeader(_pat!));
-            }
-            else
-            {
-                // Acquire token using ManagedIdentityCredential (User Assigned Managed Identity)
-                // _credential is guaranteed to be non-null when _usePat is false (initialized in constructor)
-                var tokenRequestContext = new TokenRequestContext(new[] { AzureDevOpsScope });
-                var accessToken = await _credential!.GetTokenAsync(tokenRequestContext, cancellationToken);
-
-                // Log token metadata for troubleshooting (not the token itself)
-                LogTokenMetadata(accessToken);
-
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", accessToken.Token);
-            }
-
-            request.Headers.Accept.Add(new System.Net.Http.Headers.MediaTypeWithQualityHeaderValue("application/json"));
+            await SetRequestHeadersAsync(request, cancellationToken);
 
             if (body != null)
             {
-                var jsonBody = JsonSerializer.Serialize(body, JsonOptions);
-                request.Content = new StringContent(jsonBody, Encoding.UTF8, "application/json");
+                request.Content = CreateJsonContent(JsonSerializer.SerializeToUtf8Bytes(body, JsonOptions), "application/json");
             }
 
             var response = await _httpClient.SendAsync(request, cancellationToken);
 
             if (response.IsSuccessStatusCode)
             {
-                var responseContent = await response.Content.ReadAsStringAsync(cancellationToken);
-                var result = JsonSerializer.Deserialize<T>(responseContent, JsonOptions);
+                var result = await response.Content.ReadFromJsonAsync<T>(JsonOptions, cancellationToken);
                 _logger.LogDebug("Successfully completed PUT request to Azure DevOps API: {Url}", url);
                 return result;
             }
@@ -277,7 +293,7 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
                 return null;
             }
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException || !cancellationToken.IsCancellationRequested)
         {
             _logger.LogError(ex, "Failed to make PUT request to Azure DevOps API: {Organization}/{ApiPath}", organization, apiPath);
             throw;
@@ -295,41 +311,20 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
             _logger.LogDebug("Making PATCH request to Azure DevOps API: {Url}", url);
 
             // Create HttpRequestMessage with authorization header (thread-safe approach)
-            using var request = new HttpRequestMessage(HttpMethod.Patch, url);
+            using var request = CreateRequest(HttpMethod.Patch, url);
 
-            // Set authorization header based on authentication type
-            if (_usePat)
-            {
-                // Use Basic Authentication with PAT
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Basic", CreateBasicAuthHeader(_pat!));
-            }
-            else
-            {
-                // Acquire token using ManagedIdentityCredential (User Assigned Managed Identity)
-                // _credential is guaranteed to be non-null when _usePat is false (initialized in constructor)
-                var tokenRequestContext = new TokenRequestContext(new[] { AzureDevOpsScope });
-                var accessToken = await _credential!.GetTokenAsync(tokenRequestContext, cancellationToken);
-
-                // Log token metadata for troubleshooting (not the token itself)
-                LogTokenMetadata(accessToken);
-
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", accessToken.Token);
-            }
-
-            request.Headers.Accept.Add(new System.Net.Http.Headers.MediaTypeWithQualityHeaderValue("application/json"));
+            await SetRequestHeadersAsync(request, cancellationToken);
 
             if (body != null)
             {
-                var jsonBody = JsonSerializer.Serialize(body, JsonOptions);
-                request.Content = new StringContent(jsonBody, Encoding.UTF8, "application/json-patch+json");
+                request.Content = CreateJsonContent(JsonSerializer.SerializeToUtf8Bytes(body, JsonOptions), "application/json-patch+json");
             }
 
             var response = await _httpClient.SendAsync(request, cancellationToken);
 
             if (response.IsSuccessStatusCode)
             {
-                var responseContent = await response.Content.ReadAsStringAsync(cancellationToken);
-                var result = JsonSerializer.Deserialize<T>(responseContent, JsonOptions);
+                var result = await response.Content.ReadFromJsonAsync<T>(JsonOptions, cancellationToken);
                 _logger.LogDebug("Successfully completed PATCH request to Azure DevOps API: {Url}", url);
                 return result;
             }
@@ -340,7 +335,7 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
                 return null;
             }
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException || !cancellationToken.IsCancellationRequested)
         {
             _logger.LogError(ex, "Failed to make PATCH request to Azure DevOps API: {Organization}/{ApiPath}", organization, apiPath);
             throw;
@@ -358,28 +353,9 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
             _logger.LogDebug("Making DELETE request to Azure DevOps API: {Url}", url);
 
             // Create HttpRequestMessage with authorization header (thread-safe approach)
-            using var request = new HttpRequestMessage(HttpMethod.Delete, url);
-
-            // Set authorization header based on authentication type
-            if (_usePat)
-            {
-                // Use Basic Authentication with PAT
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Basic", CreateBasicAuthHeader(_pat!));
-            }
-            else
-            {
-                // Acquire token using ManagedIdentityCredential (User Assigned Managed Identity)
-                // _credential is guaranteed to be non-null when _usePat is false (initialized in constructor)
-                var tokenRequestContext = new TokenRequestContext(new[] { AzureDevOpsScope });
-                var accessToken = await _credential!.GetTokenAsync(tokenRequestContext, cancellationToken);
-
-                // Log token metadata for troubleshooting (not the token itself)
-                LogTokenMetadata(accessToken);
+            using var request = CreateRequest(HttpMethod.Delete, url);
 
-                request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", accessToken.Token);
-            }
-
-            request.Headers.Accept.Add(new System.Net.Http.Headers.MediaTypeWithQualityHeaderValue("application/json"));
+            await SetRequestHeadersAsync(request, cancellationToken);
 
             var response = await _httpClient.SendAsync(request, cancellationToken);
 
@@ -395,7 +371,7 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
                 return false;
             }
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException || !cancellationToken.IsCancellationRequested)
         {
             _logger.LogError(ex, "Failed to make DELETE request to Azure DevOps API: {Organization}/{ApiPath}", organization, apiPath);
             throw;
@@ -420,30 +396,29 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
             return apiPath;
         }
 
-        var baseUrl = $"https://dev.azure.com/{organization}";
-
         // Remove duplicate /_apis/ prefixes
         var normalizedPath = apiPath.TrimStart('/');
 
         // If path already contains /_apis/ anywhere (e.g., {project}/_apis/git/repositories), use it as-is
         // Otherwise, prefix with /_apis/
-        var path = normalizedPath.StartsWith("_apis/", StringComparison.OrdinalIgnoreCase) ||
-                   normalizedPath.Contains("/_apis/", StringComparison.OrdinalIgnoreCase)
-            ? $"/{normalizedPath}"
-            : $"/_apis/{normalizedPath}";
+        var pathPrefix = normalizedPath.StartsWith("_apis/", StringComparison.OrdinalIgnoreCase) ||
+                         normalizedPath.Contains("/_apis/", StringComparison.OrdinalIgnoreCase)
+            ? "/"
+            : "/_apis/";
 
-        if (!string.IsNullOrEmpty(apiVersion))
+        // Build the URL in a single interpolation rather than through intermediate base URL and path strings
+        if (string.IsNullOrEmpty(apiVersion))
         {
-            var separator = path.Contains('?') ? "&" : "?";
-            path += $"{separator}api-version={apiVersion}";
+            return $"{AzureDevOpsBaseUrl}{organization}{pathPrefix}{normalizedPath}";
         }
 
-        return $"{baseUrl}{path}";
+        var versionSeparator = normalizedPath.Contains('?') ? "&api-version=" : "?api-version=";
+        return $"{AzureDevOpsBaseUrl}{organization}{pathPrefix}{normalizedPath}{versionSeparator}{apiVersion}";
     }
 
     /// <summary>
     /// Logs token metadata for troubleshooting without exposing the token itself.
-    /// Logs key claims including aud, tid, oid, upn, appid for diagnostic purposes.
+    /// Logs key claims including aud, tid, oid, upn, appid for diagnostic purposes, once per distinct token.
     /// </summary>
     private void LogTokenMetadata(AccessToken accessToken)
     {
@@ -451,6 +426,11 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
         {
             _logger.LogDebug("Token metadata - ExpiresOn: {ExpiresOn}", accessToken.ExpiresOn);
 
+            if (accessToken.ExpiresOn.UtcTicks == Volatile.Read(ref _lastDiagnosedTokenExpiry))
+            {
+                return;
+            }
+
             // Decode JWT to verify audience and issuer
             var handler = new JwtSecurityTokenHandler();
             if (handler.CanReadToken(accessToken.Token))
@@ -489,6 +469,8 @@ public class AzureDevOpsApiService : IAzureDevOpsApiService
                 {
                     _logger.LogWarning("Token audience mismatch. Expected: {ExpectedAudience}, Actual: {Audience}", ExpectedAudience, audience);
                 }
+
+                Volatile.Write(ref _lastDiagnosedTokenExpiry, accessToken.ExpiresOn.UtcTicks);
             }
             else
             {
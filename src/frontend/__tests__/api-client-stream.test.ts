@@ -0,0 +1,142 @@
+/**
+ * Tests for streamed chat replies in the API client.
+ */
+
+import { TextDecoder, TextEncoder } from 'util';
+
+jest.mock('../src/hooks/use-client-config', () => ({
+  getCachedClientConfig: jest.fn(() => null),
+}));
+
+jest.mock('../src/lib/telemetry', () => ({
+  isTelemetryEnabled: jest.fn(() => false),
+  trackApiCall: jest.fn(),
+  trackException: jest.fn(),
+}));
+
+import { ApiClient } from '../src/services/api-client';
+import { isTelemetryEnabled, trackApiCall } from '../src/lib/telemetry';
+
+const encoder = new TextEncoder();
+
+const serverSentEvent = (name: string, data: unknown) =>
+  encoder.encode(`event: ${name}\ndata: ${JSON.stringify(data)}\n\n`);
+
+/**
+ * Mock fetch with a streamed body that delivers each event after a delay.
+ * Pending reads reject when the request is aborted, as they do in browsers.
+ */
+const mockStreamingFetch = (events: Uint8Array[], delayMs: number) => {
+  (global.fetch as jest.Mock).mockImplementation(
+    async (_url: string, init: RequestInit) => {
+      const signal = init.signal as AbortSignal;
+      let index = 0;
+
+      const read = () =>
+        new Promise((resolve, reject) => {
+          signal.addEventListener('abort', () => reject(new Error('aborted')));
+          if (index >= events.length) {
+            resolve({ done: true, value: undefined });
+            return;
+          }
+          const value = events[index++];
+          setTimeout(() => resolve({ done: false, value }), delayMs);
+        });
+
+      return { ok: true, status: 200, body: { getReader: () => ({ read }) } };
+    }
+  );
+};
+
+describe('ApiClient.streamMessage', () => {
+  beforeAll(() => {
+    Object.assign(global, { TextDecoder });
+  });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    (isTelemetryEnabled as jest.Mock).mockReturnValue(false);
+    jest.useFakeTimers();
+    global.fetch = jest.fn();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('keeps a slow but steady stream open past the request timeout', async () => {
+    mockStreamingFetch(
+      [
+        serverSentEvent('chunk', 'Hello'),
+        serverSentEvent('chunk', ', world'),
+        serverSentEvent('done', {
+          message: 'Hello, world',
+          conversation_id: 'conv-1',
+          timestamp: new Date().toISOString(),
+        }),
+      ],
+      20000
+    );
+    const onChunk = jest.fn();
+
+    const reply = new ApiClient().streamMessage(
+      { message: 'Say hello', conversationId: 'conv-1' },
+      onChunk
+    );
+    // Three events 20s apart take 60s in total, but never 30s without progress
+    await jest.advanceTimersByTimeAsync(60000);
+    const response = await reply;
+
+    expect(response.success).toBe(true);
+    expect(response.data?.message).toBe('Hello, world');
+    expect(onChunk.mock.calls).toEqual([['Hello'], [', world']]);
+  });
+
+  it('gives up when the stream stalls', async () => {
+    mockStreamingFetch([serverSentEvent('chunk', 'Hello')], 45000);
+
+    const reply = new ApiClient().streamMessage(
+      { message: 'Say hello', conversationId: 'conv-1' },
+      jest.fn()
+    );
+    await jest.advanceTimersByTimeAsync(30000);
+    const response = await reply;
+
+    expect(response.success).toBe(false);
+    expect(response.error).toBe('no response for 30000ms');
+  });
+
+  it('only tracks the call when telemetry is enabled', async () => {
+    const done = serverSentEvent('done', {
+      message: 'Hi',
+      conversation_id: 'conv-1',
+      timestamp: new Date().toISOString(),
+    });
+    const client = new ApiClient();
+
+    mockStreamingFetch([done], 0);
+    const untracked = client.streamMessage(
+      { message: 'Hi', conversationId: 'conv-1' },
+      jest.fn()
+    );
+    await jest.advanceTimersByTimeAsync(0);
+    await untracked;
+    expect(trackApiCall).not.toHaveBeenCalled();
+
+    (isTelemetryEnabled as jest.Mock).mockReturnValue(true);
+    mockStreamingFetch([done], 0);
+    const tracked = client.streamMessage(
+      { message: 'Hi', conversationId: 'conv-1' },
+      jest.fn()
+    );
+    await jest.advanceTimersByTimeAsync(0);
+    await tracked;
+    expect(trackApiCall).toHaveBeenCalledWith(
+      'POST',
+      '/chat/message/stream',
+      200,
+      expect.any(Number),
+      true
+    );
+  });
+});
@@ -4,6 +4,7 @@
  */
 
 import { NextRequest } from 'next/server'
+import { GET } from '@/app/api/clientConfig/route'
 
 // Mock environment variables
 const mockEnvVars = {
@@ -22,9 +23,10 @@ const mockEnvVars = {
 
 describe('/api/clientConfig', () => {
   let originalEnv: NodeJS.ProcessEnv
-  let GET: any
 
-  beforeEach(async () => {
+  // The route reads the environment on every request, so one import serves
+  // every test without resetting the module registry in between
+  beforeEach(() => {
     // Save original environment
     originalEnv = process.env
 
@@ -33,10 +35,6 @@ describe('/api/clientConfig', () => {
       ...originalEnv,
       ...mockEnvVars
     }
-
-    // Dynamically import the GET function to ensure it uses the mocked environment
-    const module = await import('@/app/api/clientConfig/route')
-    GET = module.GET
   })
 
   afterEach(() => {
@@ -79,10 +77,7 @@ describe('/api/clientConfig', () => {
       delete process.env.AZURE_SCOPES
       // Keep FRONTEND_URL as it's now required
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -95,10 +90,7 @@ describe('/api/clientConfig', () => {
     it('should return error when AZURE_TENANT_ID is missing', async () => {
       delete process.env.AZURE_TENANT_ID
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(500)
@@ -110,10 +102,7 @@ describe('/api/clientConfig', () => {
     it('should return error when AZURE_CLIENT_ID is missing', async () => {
       delete process.env.AZURE_CLIENT_ID
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(500)
@@ -125,10 +114,7 @@ describe('/api/clientConfig', () => {
     it('should return error when BACKEND_CLIENT_ID is missing', async () => {
       delete process.env.BACKEND_CLIENT_ID
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(500)
@@ -140,10 +126,7 @@ describe('/api/clientConfig', () => {
     it('should return error when BACKEND_URL is missing', async () => {
       delete process.env.BACKEND_URL
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(500)
@@ -155,10 +138,7 @@ describe('/api/clientConfig', () => {
     it('should return error when FRONTEND_URL is missing', async () => {
       delete process.env.FRONTEND_URL
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(500)
@@ -170,10 +150,7 @@ describe('/api/clientConfig', () => {
     it('should parse scopes correctly when provided as comma-separated string', async () => {
       process.env.AZURE_SCOPES = 'scope1, scope2 , scope3'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -184,10 +161,7 @@ describe('/api/clientConfig', () => {
       process.env.AZURE_AUTHORITY = 'https://custom.authority.com'
       process.env.AZURE_REDIRECT_URI = 'https://custom.app.com/callback'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -199,10 +173,7 @@ describe('/api/clientConfig', () => {
       delete process.env.AZURE_REDIRECT_URI
       process.env.FRONTEND_URL = 'https://myapp.region.azurecontainerapps.io'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -212,10 +183,7 @@ describe('/api/clientConfig', () => {
     it('should not double-add /api suffix to backend URL', async () => {
       process.env.BACKEND_URL = 'http://localhost:8000/api'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -225,10 +193,7 @@ describe('/api/clientConfig', () => {
     it('should not duplicate backend API scope if already present in AZURE_SCOPES', async () => {
       process.env.AZURE_SCOPES = 'openid,profile,User.Read,api://test-backend-client-id/Api.All'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -241,10 +206,7 @@ describe('/api/clientConfig', () => {
     it('should disable telemetry when ENABLE_TELEMETRY is false', async () => {
       process.env.ENABLE_TELEMETRY = 'false'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -255,10 +217,7 @@ describe('/api/clientConfig', () => {
       process.env.APPLICATIONINSIGHTS_CONNECTION_STRING = ''
       process.env.ENABLE_TELEMETRY = 'true'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -270,10 +229,7 @@ describe('/api/clientConfig', () => {
       process.env.APPLICATIONINSIGHTS_CONNECTION_STRING = 'InstrumentationKey=test;IngestionEndpoint=https://test.azure.com/'
       process.env.ENABLE_TELEMETRY = 'true'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
@@ -284,14 +240,22 @@ describe('/api/clientConfig', () => {
     it('should set debug mode when DEBUG is true', async () => {
       process.env.DEBUG = 'true'
 
-      // Re-import the module to pick up env changes
-      jest.resetModules()
-      const module = await import('@/app/api/clientConfig/route')
-      const response = await module.GET()
+      const response = await GET()
       const data = await response.json()
 
       expect(response.status).toBe(200)
       expect(data.debug).toBe(true)
     })
+
+    it('should reflect environment changes between requests', async () => {
+      const first = await (await GET()).json()
+      expect(first.backend.url).toBe('http://localhost:8000/api')
+
+      process.env.BACKEND_URL = 'https://backend.example.com'
+      const second = await (await GET()).json()
+
+      expect(second.backend.url).toBe('https://backend.example.com/api')
+      expect(second.azure.scopes).toEqual(first.azure.scopes)
+    })
   })
 })
\ No newline at end of file
@@ -159,4 +159,23 @@ describe('ChatMessage Component', () => {
     const assistantWrapper = assistantContainer.querySelector('.max-w-full');
     expect(assistantWrapper).toBeInTheDocument();
   });
-});
\ No newline at end of file
+
+  it('passes the clicked suggestion to onSuggestionClick', () => {
+    const onSuggestionClick = jest.fn();
+    const assistantMessage: ChatMessage = {
+      ...mockChatMessage,
+      role: 'assistant',
+      suggestions: ['Show my work items', 'List repositories'],
+    };
+
+    render(
+      <ChatMessageComponent
+        message={assistantMessage}
+        onSuggestionClick={onSuggestionClick}
+      />
+    );
+    fireEvent.click(screen.getByText('List repositories'));
+
+    expect(onSuggestionClick).toHaveBeenCalledWith('List repositories');
+  });
+});
@@ -25,7 +25,6 @@ describe('Config', () => {
   const originalEnv = process.env;
 
   beforeEach(() => {
-    jest.resetModules();
     resetConfig(); // Reset the cached config instance
     process.env = { ...originalEnv, ...mockEnv };
   });
@@ -13,7 +13,7 @@ import { renderHook, act, waitFor } from '@testing-library/react';
 // Mock the api-client before importing the hook
 jest.mock('../src/services/api-client', () => ({
   apiClient: {
-    sendMessage: jest.fn(),
+    streamMessage: jest.fn(),
     getChatHistory: jest.fn(),
   },
 }));
@@ -55,7 +55,7 @@ describe('ConversationId Functionality', () => {
           timestamp: new Date().toISOString(),
         },
       };
-      (apiClient.sendMessage as jest.Mock).mockResolvedValue(mockResponse);
+      (apiClient.streamMessage as jest.Mock).mockResolvedValue(mockResponse);
 
       const { result } = renderHook(() => useChat());
 
@@ -105,7 +105,7 @@ describe('ConversationId Functionality', () => {
           timestamp: new Date().toISOString(),
         },
       };
-      (apiClient.sendMessage as jest.Mock).mockResolvedValue(mockResponse);
+      (apiClient.streamMessage as jest.Mock).mockResolvedValue(mockResponse);
 
       const { result } = renderHook(() => useChat());
 
@@ -116,10 +116,13 @@ describe('ConversationId Functionality', () => {
       });
 
       // Verify the API was called with the conversationId
-      expect(apiClient.sendMessage).toHaveBeenCalledWith({
-        message: 'Test message',
-        conversationId: conversationId,
-      });
+      expect(apiClient.streamMessage).toHaveBeenCalledWith(
+        {
+          message: 'Test message',
+          conversationId: conversationId,
+        },
+        expect.any(Function)
+      );
     });
 
     it('never sends undefined or null conversationId', async () => {
@@ -131,7 +134,7 @@ describe('ConversationId Functionality', () => {
           timestamp: new Date().toISOString(),
         },
       };
-      (apiClient.sendMessage as jest.Mock).mockResolvedValue(mockResponse);
+      (apiClient.streamMessage as jest.Mock).mockResolvedValue(mockResponse);
 
       const { result } = renderHook(() => useChat());
 
@@ -139,7 +142,7 @@ describe('ConversationId Functionality', () => {
         await result.current.sendMessage('Test message');
       });
 
-      const callArgs = (apiClient.sendMessage as jest.Mock).mock.calls[0][0];
+      const callArgs = (apiClient.streamMessage as jest.Mock).mock.calls[0][0];
       expect(callArgs.conversationId).toBeDefined();
       expect(callArgs.conversationId).not.toBeNull();
       expect(callArgs.conversationId).not.toBeUndefined();
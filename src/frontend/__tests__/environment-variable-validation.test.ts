@@ -5,16 +5,19 @@
 
 import { GET } from '@/app/api/clientConfig/route';
 
-// Mock NextResponse
-jest.mock('next/server', () => ({
-  NextResponse: {
-    json: jest.fn((data, options) => ({
-      json: async () => data,
-      ok: !options?.status || options.status < 400,
-      status: options?.status || 200,
-    })),
-  },
-}));
+// Mock NextResponse, constructed with a serialized body or built with json()
+jest.mock('next/server', () => {
+  const mockResponse = (data: any, options?: { status?: number }) => ({
+    json: async () => data,
+    ok: !options?.status || options.status < 400,
+    status: options?.status || 200,
+  });
+  const NextResponse: any = jest.fn((body, options) =>
+    mockResponse(JSON.parse(body), options)
+  );
+  NextResponse.json = jest.fn(mockResponse);
+  return { NextResponse };
+});
 
 describe('Environment Variable Validation', () => {
   const originalEnv = process.env;
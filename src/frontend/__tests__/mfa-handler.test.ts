@@ -138,6 +138,32 @@ describe('MfaHandler', () => {
       });
     });
 
+    it('should share one token acquisition between concurrent challenges', async () => {
+      let resolveSilent: (value: unknown) => void = () => {};
+      mockMsalInstance.acquireTokenSilent.mockImplementation(
+        () => new Promise((resolve) => (resolveSilent = resolve))
+      );
+
+      const first = mfaHandler.handleMfaChallenge(challengeDetails);
+      const second = mfaHandler.handleMfaChallenge(challengeDetails);
+      resolveSilent({ accessToken: 'shared-token' });
+
+      await expect(Promise.all([first, second])).resolves.toEqual([
+        'shared-token',
+        'shared-token',
+      ]);
+      expect(mockMsalInstance.acquireTokenSilent).toHaveBeenCalledTimes(1);
+
+      // A later challenge acquires a new token
+      mockMsalInstance.acquireTokenSilent.mockResolvedValue({
+        accessToken: 'next-token',
+      });
+      await expect(
+        mfaHandler.handleMfaChallenge(challengeDetails)
+      ).resolves.toBe('next-token');
+      expect(mockMsalInstance.acquireTokenSilent).toHaveBeenCalledTimes(2);
+    });
+
     it('should throw error when no account is available', async () => {
       const handlerWithoutAccount = new MfaHandler({
         msalInstance: mockMsalInstance as any,
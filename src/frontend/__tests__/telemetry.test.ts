@@ -15,6 +15,7 @@ import {
   flushTelemetry,
   setAuthenticatedUserContext,
   clearAuthenticatedUserContext,
+  isTelemetryEnabled,
   _resetTelemetry,
 } from '@/lib/telemetry';
 
@@ -92,6 +93,19 @@ describe('Telemetry', () => {
       consoleWarnSpy.mockRestore();
     });
 
+    it('should only check a disabled config once', () => {
+      const consoleWarnSpy = jest.spyOn(console, 'warn').mockImplementation();
+      (global as any).window.__CLIENT_CONFIG__.telemetry.enabled = false;
+
+      initializeTelemetry();
+      trackEvent('FirstEvent');
+      trackChatMessage('user', 10);
+
+      expect(consoleWarnSpy).toHaveBeenCalledTimes(1);
+      expect(MockApplicationInsightsConstructor).not.toHaveBeenCalled();
+      consoleWarnSpy.mockRestore();
+    });
+
     it('should not initialize when connection string is missing', () => {
       (global as any).window.__CLIENT_CONFIG__.telemetry.connectionString = '';
 
@@ -118,6 +132,20 @@ describe('Telemetry', () => {
     });
   });
 
+  describe('isTelemetryEnabled', () => {
+    it('should report enabled telemetry', () => {
+      expect(isTelemetryEnabled()).toBe(true);
+    });
+
+    it('should report disabled telemetry', () => {
+      jest.spyOn(console, 'warn').mockImplementation();
+      (global as any).window.__CLIENT_CONFIG__.telemetry.enabled = false;
+
+      expect(isTelemetryEnabled()).toBe(false);
+      (console.warn as jest.Mock).mockRestore();
+    });
+  });
+
   describe('trackPageView', () => {
     beforeEach(() => {
       initializeTelemetry();
@@ -235,6 +263,16 @@ describe('Telemetry', () => {
       });
     });
 
+    it('should send the batch immediately for critical exceptions', () => {
+      const error = new Error('Fatal error');
+
+      trackException(error, undefined, 3);
+      expect(mockAppInsights.flush).not.toHaveBeenCalled();
+
+      trackException(error, undefined, 4);
+      expect(mockAppInsights.flush).toHaveBeenCalledTimes(1);
+    });
+
     it('should fallback to console.error when AI is not initialized', () => {
       const consoleErrorSpy = jest
         .spyOn(console, 'error')
@@ -4,6 +4,7 @@
 
 import { renderHook, act } from '@testing-library/react';
 import { useAuth } from '@/hooks/use-auth';
+import { setAuthenticatedUserContext } from '@/lib/telemetry';
 import { setCachedClientConfig, clearCachedClientConfig } from '@/hooks/use-client-config';
 import { createMockClientConfigWithBackendScope, createMockClientConfigOidcOnly } from './test-helpers';
 
@@ -35,15 +36,30 @@ jest.mock('@/lib/telemetry', () => ({
   trackAuthEvent: jest.fn(),
   trackApiCall: jest.fn(),
   trackException: jest.fn(),
+  setAuthenticatedUserContext: jest.fn(),
+  clearAuthenticatedUserContext: jest.fn(),
 }), { virtual: true });
 
 // Mock API client - create a manual mock
 jest.mock('@/services/api-client', () => ({
   apiClient: {
     setAccessToken: jest.fn(),
+    setBackendApiToken: jest.fn(),
+    setMfaHandler: jest.fn(),
   },
 }), { virtual: true });
 
+// Render the hook and let its initial token acquisition settle
+const renderSettledAuth = async () => {
+  const hook = renderHook(() => useAuth());
+
+  await act(async () => {
+    await new Promise(resolve => setTimeout(resolve, 0));
+  });
+
+  return hook;
+};
+
 describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
   const mockClientConfigWithBackendScope = createMockClientConfigWithBackendScope();
   const mockClientConfigOidcOnly = createMockClientConfigOidcOnly();
@@ -65,12 +81,7 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
         accessToken: 'oidc-access-token'
       });
 
-      const { result } = renderHook(() => useAuth());
-
-      // Wait for initial auth state to settle
-      await act(async () => {
-        await new Promise(resolve => setTimeout(resolve, 0));
-      });
+      const { result } = await renderSettledAuth();
 
       let oidcToken;
       await act(async () => {
@@ -89,11 +100,7 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
       
       mockInstance.acquireTokenSilent.mockRejectedValue(new Error('Token acquisition failed'));
 
-      const { result } = renderHook(() => useAuth());
-
-      await act(async () => {
-        await new Promise(resolve => setTimeout(resolve, 0));
-      });
+      const { result } = await renderSettledAuth();
 
       let oidcToken;
       await act(async () => {
@@ -112,11 +119,7 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
         accessToken: 'backend-api-access-token'
       });
 
-      const { result } = renderHook(() => useAuth());
-
-      await act(async () => {
-        await new Promise(resolve => setTimeout(resolve, 0));
-      });
+      const { result } = await renderSettledAuth();
 
       let backendToken;
       await act(async () => {
@@ -133,11 +136,7 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
     it('should return null when no backend API scopes are available', async () => {
       setCachedClientConfig(mockClientConfigOidcOnly);
 
-      const { result } = renderHook(() => useAuth());
-
-      await act(async () => {
-        await new Promise(resolve => setTimeout(resolve, 0));
-      });
+      const { result } = await renderSettledAuth();
 
       let backendToken;
       await act(async () => {
@@ -154,11 +153,7 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
       
       mockInstance.acquireTokenSilent.mockRejectedValue(new Error('API token acquisition failed'));
 
-      const { result } = renderHook(() => useAuth());
-
-      await act(async () => {
-        await new Promise(resolve => setTimeout(resolve, 0));
-      });
+      const { result } = await renderSettledAuth();
 
       let backendToken;
       await act(async () => {
@@ -177,11 +172,7 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
         accessToken: 'combined-access-token'
       });
 
-      const { result } = renderHook(() => useAuth());
-
-      await act(async () => {
-        await new Promise(resolve => setTimeout(resolve, 0));
-      });
+      const { result } = await renderSettledAuth();
 
       let accessToken;
       await act(async () => {
@@ -196,7 +187,46 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
       });
     });
 
-    it('should maintain all existing auth hook properties', () => {
+    it('should reacquire the access token once the cached one has expired', async () => {
+      setCachedClientConfig(mockClientConfigWithBackendScope);
+
+      mockInstance.acquireTokenSilent.mockResolvedValue({
+        accessToken: 'expired-access-token',
+        expiresOn: new Date(Date.now() - 1000),
+      });
+
+      const { result } = await renderSettledAuth();
+
+      mockInstance.acquireTokenSilent.mockClear();
+      mockInstance.acquireTokenSilent.mockResolvedValue({
+        accessToken: 'fresh-access-token',
+        expiresOn: new Date(Date.now() + 60 * 60 * 1000),
+      });
+
+      let accessToken;
+      await act(async () => {
+        accessToken = await result.current.getAccessToken();
+      });
+
+      expect(accessToken).toBe('fresh-access-token');
+      expect(mockInstance.acquireTokenSilent).toHaveBeenCalledTimes(1);
+      expect(result.current.accessToken).toBe('fresh-access-token');
+    });
+
+    it('should attribute telemetry to the signed-in user once', async () => {
+      setCachedClientConfig(mockClientConfigWithBackendScope);
+
+      mockInstance.acquireTokenSilent.mockResolvedValue({
+        accessToken: 'combined-access-token'
+      });
+
+      await renderSettledAuth();
+
+      expect(setAuthenticatedUserContext).toHaveBeenCalledTimes(1);
+      expect(setAuthenticatedUserContext).toHaveBeenCalledWith('test-account-id');
+    });
+
+        it('should maintain all existing auth hook properties', () => {
       const { result } = renderHook(() => useAuth());
 
       // Check that all original properties still exist
@@ -230,11 +260,7 @@ describe('useAuth Hook - Split Token Methods (Issue #232)', () => {
         .mockResolvedValueOnce({ accessToken: 'oidc-token' })          // For explicit OIDC request
         .mockResolvedValueOnce({ accessToken: 'backend-api-token' });  // For explicit backend request
 
-      const { result } = renderHook(() => useAuth());
-
-      await act(async () => {
-        await new Promise(resolve => setTimeout(resolve, 0));
-      });
+      const { result } = await renderSettledAuth();
 
       let oidcToken, backendToken;
       await act(async () => {
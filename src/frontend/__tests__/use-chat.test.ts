@@ -0,0 +1,272 @@
+/**
+ * Tests for useChat message sending behavior.
+ */
+
+import { renderHook, act } from '@testing-library/react';
+
+// Mock the api-client before importing the hook
+jest.mock('../src/services/api-client', () => ({
+  apiClient: {
+    streamMessage: jest.fn(),
+    getChatHistory: jest.fn(),
+  },
+}));
+
+// Mock telemetry
+jest.mock('../src/lib/telemetry', () => ({
+  trackChatMessage: jest.fn(),
+  trackEvent: jest.fn(),
+}));
+
+import { useChat, isLowSignalMessage } from '../src/hooks/use-chat';
+import { apiClient } from '../src/services/api-client';
+
+const createMockResponse = (message: string) => ({
+  success: true,
+  data: {
+    message,
+    conversation_id: 'backend-conv-id',
+    timestamp: new Date().toISOString(),
+  },
+});
+
+describe('useChat', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('sendMessage', () => {
+    it('coalesces messages sent while a reply is pending into one request', async () => {
+      let resolveFirst: (value: unknown) => void = () => {};
+      (apiClient.streamMessage as jest.Mock)
+        .mockImplementationOnce(
+          () => new Promise((resolve) => (resolveFirst = resolve))
+        )
+        .mockResolvedValueOnce(createMockResponse('Second reply'));
+
+      const { result } = renderHook(() => useChat());
+
+      let first: Promise<boolean> = Promise.resolve(false);
+      let second: Promise<boolean> = Promise.resolve(false);
+      let third: Promise<boolean> = Promise.resolve(false);
+      act(() => {
+        first = result.current.sendMessage('First');
+        second = result.current.sendMessage('Second');
+        third = result.current.sendMessage('Third');
+      });
+
+      await act(async () => {
+        resolveFirst(createMockResponse('First reply'));
+        await Promise.all([first, second, third]);
+      });
+
+      expect(apiClient.streamMessage).toHaveBeenCalledTimes(2);
+      expect((apiClient.streamMessage as jest.Mock).mock.calls[1][0].message).toBe(
+        'Second\n\nThird'
+      );
+      await expect(second).resolves.toBe(true);
+      await expect(third).resolves.toBe(true);
+
+      // Every user message is still shown individually
+      const userMessages = result.current.messages.filter(
+        (msg) => msg.role === 'user'
+      );
+      expect(userMessages.map((msg) => msg.content)).toEqual([
+        'First',
+        'Second',
+        'Third',
+      ]);
+    });
+
+    it('ignores a repeat of the message still awaiting its reply', async () => {
+      let resolveFirst: (value: unknown) => void = () => {};
+      (apiClient.streamMessage as jest.Mock).mockImplementationOnce(
+        () => new Promise((resolve) => (resolveFirst = resolve))
+      );
+
+      const { result } = renderHook(() => useChat());
+
+      let first: Promise<boolean> = Promise.resolve(false);
+      let repeat: Promise<boolean> = Promise.resolve(false);
+      act(() => {
+        first = result.current.sendMessage('List my projects');
+        repeat = result.current.sendMessage('List my projects');
+      });
+
+      await act(async () => {
+        resolveFirst(createMockResponse('Here are your projects'));
+        await Promise.all([first, repeat]);
+      });
+
+      expect(apiClient.streamMessage).toHaveBeenCalledTimes(1);
+      await expect(repeat).resolves.toBe(true);
+      expect(
+        result.current.messages.filter((msg) => msg.role === 'user')
+      ).toHaveLength(1);
+    });
+
+    it('answers bare acknowledgements without calling the backend', async () => {
+      const { result } = renderHook(() => useChat());
+
+      let success = false;
+      await act(async () => {
+        success = await result.current.sendMessage('Thanks!');
+      });
+
+      expect(success).toBe(true);
+      expect(apiClient.streamMessage).not.toHaveBeenCalled();
+      expect(result.current.messages.map((msg) => msg.role)).toEqual([
+        'user',
+        'assistant',
+      ]);
+    });
+
+    it('queues an acknowledgement sent while a reply is pending', async () => {
+      let resolveFirst: (value: unknown) => void = () => {};
+      (apiClient.streamMessage as jest.Mock)
+        .mockImplementationOnce(
+          () => new Promise((resolve) => (resolveFirst = resolve))
+        )
+        .mockResolvedValueOnce(createMockResponse('Happy to help'));
+
+      const { result } = renderHook(() => useChat());
+
+      let first: Promise<boolean> = Promise.resolve(false);
+      let thanks: Promise<boolean> = Promise.resolve(false);
+      act(() => {
+        first = result.current.sendMessage('List my projects');
+        thanks = result.current.sendMessage('Thanks!');
+      });
+
+      // Nothing is answered before the pending reply arrives
+      expect(result.current.messages.map((msg) => msg.role)).toEqual([
+        'user',
+        'user',
+      ]);
+
+      await act(async () => {
+        resolveFirst(createMockResponse('Here are your projects'));
+        await Promise.all([first, thanks]);
+      });
+
+      expect(apiClient.streamMessage).toHaveBeenCalledTimes(2);
+      expect(
+        result.current.messages
+          .filter((msg) => msg.role === 'assistant')
+          .map((msg) => msg.content)
+      ).toEqual(['Here are your projects', 'Happy to help']);
+    });
+  });
+
+  describe('clearChat', () => {
+    it('sends the next message in the new conversation while the old reply is pending', async () => {
+      let resolveFirst: (value: unknown) => void = () => {};
+      (apiClient.streamMessage as jest.Mock)
+        .mockImplementationOnce(
+          () => new Promise((resolve) => (resolveFirst = resolve))
+        )
+        .mockResolvedValueOnce(createMockResponse('New reply'));
+
+      const { result } = renderHook(() => useChat());
+      const oldConversationId = result.current.conversationId;
+
+      let first: Promise<boolean> = Promise.resolve(false);
+      act(() => {
+        first = result.current.sendMessage('Old question');
+      });
+      act(() => {
+        result.current.clearChat();
+      });
+
+      const newConversationId = result.current.conversationId;
+      expect(newConversationId).not.toBe(oldConversationId);
+
+      await act(async () => {
+        await result.current.sendMessage('New question');
+      });
+
+      // The new message is sent right away rather than queued behind the old reply
+      expect(apiClient.streamMessage).toHaveBeenCalledTimes(2);
+      expect(
+        (apiClient.streamMessage as jest.Mock).mock.calls[1][0].conversationId
+      ).toBe(newConversationId);
+
+      await act(async () => {
+        resolveFirst(createMockResponse('Old reply'));
+        await first;
+      });
+
+      // The old reply is not added to the cleared chat
+      expect(apiClient.streamMessage).toHaveBeenCalledTimes(2);
+      expect(result.current.messages.map((msg) => msg.content)).toEqual([
+        'New question',
+        'New reply',
+      ]);
+    });
+  });
+
+  describe('streaming replies', () => {
+    it('shows streamed content in a single assistant message', async () => {
+      (apiClient.streamMessage as jest.Mock).mockImplementationOnce(
+        async (_request, onChunk: (chunk: string) => void) => {
+          onChunk('Hello');
+          onChunk(', world');
+          return createMockResponse('Hello, world');
+        }
+      );
+
+      const { result } = renderHook(() => useChat());
+
+      await act(async () => {
+        await result.current.sendMessage('Say hello');
+      });
+
+      const assistantMessages = result.current.messages.filter(
+        (msg) => msg.role === 'assistant'
+      );
+      expect(assistantMessages).toHaveLength(1);
+      expect(assistantMessages[0].content).toBe('Hello, world');
+    });
+
+    it('replaces a partially streamed reply with the error when the stream fails', async () => {
+      (apiClient.streamMessage as jest.Mock).mockImplementationOnce(
+        async (_request, onChunk: (chunk: string) => void) => {
+          onChunk('Partial');
+          return { success: false, error: 'Stream interrupted' };
+        }
+      );
+
+      const { result } = renderHook(() => useChat());
+
+      let success = true;
+      await act(async () => {
+        success = await result.current.sendMessage('Say hello');
+      });
+
+      expect(success).toBe(false);
+      const assistantMessages = result.current.messages.filter(
+        (msg) => msg.role === 'assistant'
+      );
+      expect(assistantMessages.map((msg) => msg.content)).toEqual([
+        'Sorry, I encountered an error: Stream interrupted',
+      ]);
+      expect(result.current.error).toBe('Stream interrupted');
+    });
+  });
+
+  describe('isLowSignalMessage', () => {
+    it.each(['thanks', 'Thank you!', 'thx.', '  cheers  '])(
+      'treats "%s" as low signal',
+      (message) => {
+        expect(isLowSignalMessage(message)).toBe(true);
+      }
+    );
+
+    it.each(['yes', 'no', 'ok', 'thanks, now list my repositories'])(
+      'forwards "%s" to the backend',
+      (message) => {
+        expect(isLowSignalMessage(message)).toBe(false);
+      }
+    );
+  });
+});
@@ -92,6 +92,35 @@ describe('useClientConfig', () => {
       expect(fetch).toHaveBeenCalledWith('/api/clientConfig')
     })
   })
+
+  it('should reuse cached configuration without fetching', () => {
+    setCachedClientConfig(mockClientConfig)
+
+    const { result } = renderHook(() => useClientConfig())
+
+    expect(result.current.loading).toBe(false)
+    expect(result.current.config).toEqual(mockClientConfig)
+    expect(fetch).not.toHaveBeenCalled()
+  })
+
+  it('should share one request between components loading at the same time', async () => {
+    (fetch as jest.Mock).mockResolvedValueOnce({
+      ok: true,
+      json: async () => mockClientConfig
+    })
+
+    const first = renderHook(() => useClientConfig())
+    const second = renderHook(() => useClientConfig())
+
+    await waitFor(() => {
+      expect(first.result.current.loading).toBe(false)
+      expect(second.result.current.loading).toBe(false)
+    })
+
+    expect(fetch).toHaveBeenCalledTimes(1)
+    expect(first.result.current.config).toEqual(mockClientConfig)
+    expect(second.result.current.config).toEqual(mockClientConfig)
+  })
 })
 
 describe('Client config cache utilities', () => {
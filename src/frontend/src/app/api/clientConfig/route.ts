@@ -32,6 +32,21 @@ export interface ClientConfigResponse {
   debug: boolean;
 }
 
+// Serialized config built from the last set of environment values seen. The
+// environment is fixed for a deployment, so scopes and URLs are only derived
+// and stringified again if a value changes rather than on every request.
+let cachedEnvKey: string | null = null;
+let cachedConfigBody: string | null = null;
+
+/**
+ * Build a JSON response from an already serialized config body
+ */
+function configResponse(body: string): NextResponse {
+  return new NextResponse(body, {
+    headers: { 'Content-Type': 'application/json' },
+  });
+}
+
 export async function GET() {
   try {
     // Read configuration from server-side environment variables
@@ -68,6 +83,23 @@ export async function GET() {
       throw new Error('FRONTEND_URL environment variable is not set');
     }
 
+    const envKey = [
+      tenantId,
+      clientId,
+      backendClientId,
+      backendUrl,
+      frontendUrl,
+      authority,
+      redirectUri,
+      scopes,
+      appInsightsConnectionString,
+      enableTelemetry,
+      debugMode,
+    ].join('\n');
+    if (cachedConfigBody && envKey === cachedEnvKey) {
+      return configResponse(cachedConfigBody);
+    }
+
     // Construct scopes array with OIDC scopes and backend API scope
     const defaultScopes = ['openid', 'profile', 'User.Read', 'email'];
     const backendApiScope = `api://${backendClientId}/Api.All`;
@@ -103,7 +135,9 @@ export async function GET() {
       debug: debugMode,
     };
 
-    return NextResponse.json(config);
+    cachedEnvKey = envKey;
+    cachedConfigBody = JSON.stringify(config);
+    return configResponse(cachedConfigBody);
   } catch (error) {
     console.error('Failed to load client configuration:', error);
 
@@ -61,8 +61,7 @@ export function ChatInput({
             onChange={handleTextareaChange}
             onKeyDown={handleKeyDown}
             placeholder="Type your message here... (Press Enter to send, Shift+Enter for new line)"
-            className="w-full resize-none border border-gray-300 rounded-md px-3 py-2 text-sm text-gray-900 placeholder-gray-400 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
-            style={{ minHeight: '40px', maxHeight: '150px' }}
+            className="w-full resize-none border border-gray-300 rounded-md px-3 py-2 text-sm text-gray-900 placeholder-gray-400 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent min-h-[40px] max-h-[150px]"
             disabled={disabled || loading}
             rows={1}
           />
@@ -2,7 +2,13 @@
  * Main chat interface component.
  */
 
-import React, { useEffect, useRef, useState } from 'react';
+import React, {
+  useCallback,
+  useEffect,
+  useMemo,
+  useRef,
+  useState,
+} from 'react';
 import { ChatMessageComponent } from './ChatMessage';
 import { ChatInput } from './ChatInput';
 import { Button } from './Button';
@@ -17,6 +23,14 @@ interface SelectedThoughtProcess {
   conversationId: string;
 }
 
+// Example prompts shown on the empty conversation screen
+const EXAMPLE_PROMPTS = [
+  'Show me my active work items',
+  'List all repositories in my project',
+  'What are the recent pipeline runs?',
+  'Create a new user story',
+] as const;
+
 export function ChatInterface() {
   const {
     messages,
@@ -38,27 +52,30 @@ export function ChatInterface() {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
   }, [messages]);
 
-  // Get the latest assistant message with a thought process
-  const getLatestThoughtProcess = (): SelectedThoughtProcess | null => {
-    const assistantMessages = messages.filter(
-      (msg) =>
-        msg.role === 'assistant' && msg.thoughtProcessId && msg.conversationId
-    );
-    if (assistantMessages.length > 0) {
-      const lastMessage = assistantMessages[assistantMessages.length - 1];
-      return {
-        thoughtProcessId: lastMessage.thoughtProcessId!,
-        conversationId: lastMessage.conversationId!,
-      };
+  // Latest assistant message with a thought process, recomputed only when
+  // messages change and found by scanning back from the newest message
+  const latestThoughtProcess = useMemo((): SelectedThoughtProcess | null => {
+    for (let i = messages.length - 1; i >= 0; i--) {
+      const msg = messages[i];
+      if (
+        msg.role === 'assistant' &&
+        msg.thoughtProcessId &&
+        msg.conversationId
+      ) {
+        return {
+          thoughtProcessId: msg.thoughtProcessId,
+          conversationId: msg.conversationId,
+        };
+      }
     }
     return null;
-  };
+  }, [messages]);
 
   // Handle tab change
   const handleTabChange = (tab: TabType) => {
     setActiveTab(tab);
     if (tab === 'thought' && !selectedThoughtProcess) {
-      setSelectedThoughtProcess(getLatestThoughtProcess());
+      setSelectedThoughtProcess(latestThoughtProcess);
     }
   };
 
@@ -71,6 +88,18 @@ export function ChatInterface() {
     setActiveTab('thought');
   };
 
+  // One handler shared by every example prompt; the prompt is read from the
+  // clicked button instead of being captured in a closure per button
+  const handleExampleClick = useCallback(
+    (event: React.MouseEvent<HTMLButtonElement>) => {
+      const example = event.currentTarget.dataset.example;
+      if (example) {
+        sendMessage(example);
+      }
+    },
+    [sendMessage]
+  );
+
   return (
     <div className="flex flex-col h-full bg-white">
       {/* Header */}
@@ -118,10 +147,10 @@ export function ChatInterface() {
                   ? 'bg-white text-blue-700 border-b-2 border-blue-700'
                   : 'text-blue-100 hover:text-white hover:bg-blue-600'
               }`}
-              disabled={!getLatestThoughtProcess()}
+              disabled={!latestThoughtProcess}
             >
               🧠 Thought Process
-              {!getLatestThoughtProcess() && (
+              {!latestThoughtProcess && (
                 <span className="ml-1 text-xs opacity-75">(unavailable)</span>
               )}
             </button>
@@ -166,16 +195,12 @@ export function ChatInterface() {
                       Try asking:
                     </h3>
                     <div className="grid grid-cols-1 md:grid-cols-2 gap-2 text-sm">
-                      {[
-                        'Show me my active work items',
-                        'List all repositories in my project',
-                        'What are the recent pipeline runs?',
-                        'Create a new user story',
-                      ].map((example, index) => (
+                      {EXAMPLE_PROMPTS.map((example) => (
                         <button
-                          key={index}
+                          key={example}
                           className="text-left p-3 bg-gray-50 hover:bg-gray-100 rounded-md border border-gray-200 transition-colors text-gray-800"
-                          onClick={() => sendMessage(example)}
+                          data-example={example}
+                          onClick={handleExampleClick}
                         >
                           &quot;{example}&quot;
                         </button>
@@ -2,7 +2,7 @@
  * Individual chat message component.
  */
 
-import React from 'react';
+import React, { useCallback, useMemo } from 'react';
 import ReactMarkdown from 'react-markdown';
 import remarkGfm from 'remark-gfm';
 import { ExternalLink, BookOpen, FileText, Info } from 'lucide-react';
@@ -13,34 +13,56 @@ interface ChatMessageProps {
   onSuggestionClick?: (suggestion: string) => void;
 }
 
-export function ChatMessageComponent({
+// Typography classes for assistant markdown, shared by every message
+const MARKDOWN_PROSE_CLASSES =
+  'text-sm leading-relaxed prose prose-sm max-w-none prose-slate prose-p:my-2 prose-p:text-gray-900 prose-headings:my-2 prose-headings:text-gray-900 prose-headings:font-semibold prose-ul:my-1 prose-ol:my-1 prose-li:my-0.5 prose-li:text-gray-900 prose-table:my-2 prose-thead:bg-gray-200 prose-th:px-3 prose-th:py-2 prose-th:font-semibold prose-th:text-gray-900 prose-td:px-3 prose-td:py-2 prose-td:text-gray-900 prose-tr:border-gray-300 prose-strong:text-gray-900 prose-strong:font-semibold prose-code:text-gray-900 prose-pre:bg-gray-800 prose-pre:text-gray-100';
+
+// Locale formatters are expensive to construct, so build them once
+const timeFormatter = new Intl.DateTimeFormat([], {
+  hour: '2-digit',
+  minute: '2-digit',
+});
+const dateTimeFormatter = new Intl.DateTimeFormat([], {
+  month: 'short',
+  day: 'numeric',
+  hour: '2-digit',
+  minute: '2-digit',
+});
+
+// Format timestamp based on user's locale
+// Show date and time for older messages, just time for today's messages
+function formatTimestamp(date: Date): string {
+  const isToday = date.toDateString() === new Date().toDateString();
+
+  return isToday ? timeFormatter.format(date) : dateTimeFormatter.format(date);
+}
+
+// Memoized so appending a message re-renders only the new entry, not the
+// whole conversation
+export const ChatMessageComponent = React.memo(function ChatMessageComponent({
   message,
   onSuggestionClick,
 }: ChatMessageProps) {
   const isUser = message.role === 'user';
 
-  // Format timestamp based on user's locale
-  // Show date and time for older messages, just time for today's messages
-  const formatTimestamp = (date: Date): string => {
-    const now = new Date();
-    const isToday = date.toDateString() === now.toDateString();
-
-    if (isToday) {
-      return date.toLocaleTimeString([], {
-        hour: '2-digit',
-        minute: '2-digit',
-      });
-    } else {
-      return date.toLocaleString([], {
-        month: 'short',
-        day: 'numeric',
-        hour: '2-digit',
-        minute: '2-digit',
-      });
-    }
-  };
-
-  const timestamp = formatTimestamp(message.timestamp);
+  // Streamed replies re-render on every chunk, so only re-format when the
+  // timestamp itself changes
+  const timestamp = useMemo(
+    () => formatTimestamp(message.timestamp),
+    [message.timestamp]
+  );
+
+  // One handler for every suggestion button rather than a closure per button
+  // on each render
+  const handleSuggestionClick = useCallback(
+    (event: React.MouseEvent<HTMLButtonElement>) => {
+      const suggestion = event.currentTarget.dataset.suggestion;
+      if (suggestion) {
+        onSuggestionClick?.(suggestion);
+      }
+    },
+    [onSuggestionClick]
+  );
 
   return (
     <div className={`flex ${isUser ? 'justify-end' : 'justify-start'} mb-4`}>
@@ -56,7 +78,7 @@ export function ChatMessageComponent({
         >
           {/* Render content based on format */}
           {message.format === 'markdown' && !isUser ? (
-            <div className="text-sm leading-relaxed prose prose-sm max-w-none prose-slate prose-p:my-2 prose-p:text-gray-900 prose-headings:my-2 prose-headings:text-gray-900 prose-headings:font-semibold prose-ul:my-1 prose-ol:my-1 prose-li:my-0.5 prose-li:text-gray-900 prose-table:my-2 prose-thead:bg-gray-200 prose-th:px-3 prose-th:py-2 prose-th:font-semibold prose-th:text-gray-900 prose-td:px-3 prose-td:py-2 prose-td:text-gray-900 prose-tr:border-gray-300 prose-strong:text-gray-900 prose-strong:font-semibold prose-code:text-gray-900 prose-pre:bg-gray-800 prose-pre:text-gray-100">
+            <div className={MARKDOWN_PROSE_CLASSES}>
               <div className="overflow-x-auto">
                 <ReactMarkdown remarkPlugins={[remarkGfm]}>
                   {message.content}
@@ -102,7 +124,8 @@ export function ChatMessageComponent({
                 <button
                   key={index}
                   className="block text-left text-xs bg-gray-50 hover:bg-gray-100 border border-gray-200 rounded px-2 py-1 text-gray-700 transition-colors"
-                  onClick={() => onSuggestionClick?.(suggestion)}
+                  data-suggestion={suggestion}
+                  onClick={handleSuggestionClick}
                 >
                   {suggestion}
                 </button>
@@ -113,7 +136,7 @@ export function ChatMessageComponent({
       </div>
     </div>
   );
-}
+});
 
 function CitationComponent({ citation }: { citation: Citation }) {
   const icon = getCitationIcon(citation.type);
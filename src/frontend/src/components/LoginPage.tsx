@@ -7,6 +7,12 @@ import { Button } from './Button';
 import { useAuth } from '@/hooks/use-auth';
 import { ConfigStatus } from './ConfigStatus';
 
+const LOGIN_FEATURES = [
+  'Secured with Microsoft Entra ID',
+  'Powered by Azure OpenAI',
+  'Built with Next.js & TypeScript',
+];
+
 export function LoginPage() {
   const { login, isLoading, error } = useAuth();
 
@@ -101,54 +107,24 @@ export function LoginPage() {
             </div>
 
             <div className="text-xs text-gray-500 space-y-2">
-              <div className="flex items-center">
-                <svg
-                  className="w-4 h-4 text-green-500 mr-2"
-                  fill="none"
-                  stroke="currentColor"
-                  viewBox="0 0 24 24"
-                >
-                  <path
-                    strokeLinecap="round"
-                    strokeLinejoin="round"
-                    strokeWidth={2}
-                    d="M5 13l4 4L19 7"
-                  />
-                </svg>
-                Secured with Microsoft Entra ID
-              </div>
-              <div className="flex items-center">
-                <svg
-                  className="w-4 h-4 text-green-500 mr-2"
-                  fill="none"
-                  stroke="currentColor"
-                  viewBox="0 0 24 24"
-                >
-                  <path
-                    strokeLinecap="round"
-                    strokeLinejoin="round"
-                    strokeWidth={2}
-                    d="M5 13l4 4L19 7"
-                  />
-                </svg>
-                Powered by Azure OpenAI
-              </div>
-              <div className="flex items-center">
-                <svg
-                  className="w-4 h-4 text-green-500 mr-2"
-                  fill="none"
-                  stroke="currentColor"
-                  viewBox="0 0 24 24"
-                >
-                  <path
-                    strokeLinecap="round"
-                    strokeLinejoin="round"
-                    strokeWidth={2}
-                    d="M5 13l4 4L19 7"
-                  />
-                </svg>
-                Built with Next.js & TypeScript
-              </div>
+              {LOGIN_FEATURES.map((feature) => (
+                <div key={feature} className="flex items-center">
+                  <svg
+                    className="w-4 h-4 text-green-500 mr-2"
+                    fill="none"
+                    stroke="currentColor"
+                    viewBox="0 0 24 24"
+                  >
+                    <path
+                      strokeLinecap="round"
+                      strokeLinejoin="round"
+                      strokeWidth={2}
+                      d="M5 13l4 4L19 7"
+                    />
+                  </svg>
+                  {feature}
+                </div>
+              ))}
             </div>
           </div>
         </div>
@@ -133,6 +133,44 @@ export function ThoughtProcess({
   );
 }
 
+/**
+ * Icon and color lookup tables keyed by thought step type.
+ */
+const STEP_ICONS: Record<string, string> = {
+  analysis: '🔍',
+  planning: '📋',
+  reasoning: '🤔',
+  tool_invocation: '🔧',
+  completion: '✅',
+  post_processing: '⚙️',
+  error: '❌',
+};
+const DEFAULT_STEP_ICON = '💭';
+
+const STEP_COLORS: Record<string, string> = {
+  analysis: 'bg-blue-50 border-blue-200',
+  planning: 'bg-purple-50 border-purple-200',
+  reasoning: 'bg-yellow-50 border-yellow-200',
+  tool_invocation: 'bg-green-50 border-green-200',
+  completion: 'bg-emerald-50 border-emerald-200',
+  post_processing: 'bg-gray-50 border-gray-200',
+  error: 'bg-red-50 border-red-200',
+};
+const DEFAULT_STEP_COLOR = 'bg-gray-50 border-gray-200';
+
+/**
+ * Badge colors keyed by lower-cased tool invocation status.
+ */
+const TOOL_STATUS_COLORS: Record<string, string> = {
+  success: 'text-green-600 bg-green-50',
+  completed: 'text-green-600 bg-green-50',
+  failed: 'text-red-600 bg-red-50',
+  error: 'text-red-600 bg-red-50',
+  pending: 'text-yellow-600 bg-yellow-50',
+  running: 'text-yellow-600 bg-yellow-50',
+};
+const DEFAULT_TOOL_STATUS_COLOR = 'text-gray-600 bg-gray-50';
+
 interface ThoughtStepComponentProps {
   step: ThoughtStep;
   index: number;
@@ -140,58 +178,18 @@ interface ThoughtStepComponentProps {
 
 function ThoughtStepComponent({ step, index }: ThoughtStepComponentProps) {
   const [expanded, setExpanded] = useState(false);
-
-  const getStepIcon = (type: string) => {
-    switch (type) {
-      case 'analysis':
-        return '🔍';
-      case 'planning':
-        return '📋';
-      case 'reasoning':
-        return '🤔';
-      case 'tool_invocation':
-        return '🔧';
-      case 'completion':
-        return '✅';
-      case 'post_processing':
-        return '⚙️';
-      case 'error':
-        return '❌';
-      default:
-        return '💭';
-    }
-  };
-
-  const getStepColor = (type: string) => {
-    switch (type) {
-      case 'analysis':
-        return 'bg-blue-50 border-blue-200';
-      case 'planning':
-        return 'bg-purple-50 border-purple-200';
-      case 'reasoning':
-        return 'bg-yellow-50 border-yellow-200';
-      case 'tool_invocation':
-        return 'bg-green-50 border-green-200';
-      case 'completion':
-        return 'bg-emerald-50 border-emerald-200';
-      case 'post_processing':
-        return 'bg-gray-50 border-gray-200';
-      case 'error':
-        return 'bg-red-50 border-red-200';
-      default:
-        return 'bg-gray-50 border-gray-200';
-    }
-  };
+  const stepIcon = STEP_ICONS[step.type] ?? DEFAULT_STEP_ICON;
+  const stepColor = STEP_COLORS[step.type] ?? DEFAULT_STEP_COLOR;
 
   return (
-    <div className={`border rounded-lg p-3 ${getStepColor(step.type)}`}>
+    <div className={`border rounded-lg p-3 ${stepColor}`}>
       <div className="flex items-start space-x-3">
         <div className="flex-shrink-0 w-6 h-6 bg-white rounded-full border border-gray-300 flex items-center justify-center text-sm font-medium">
           {index}
         </div>
         <div className="flex-1 min-w-0">
           <div className="flex items-center space-x-2">
-            <span className="text-lg">{getStepIcon(step.type)}</span>
+            <span className="text-lg">{stepIcon}</span>
             <span className="text-sm font-medium text-gray-900 capitalize">
               {step.type.replace('_', ' ')}
             </span>
@@ -234,22 +232,8 @@ function ToolInvocationComponent({
   index,
 }: ToolInvocationComponentProps) {
   const [expanded, setExpanded] = useState(false);
-
-  const getStatusColor = (status: string) => {
-    switch (status.toLowerCase()) {
-      case 'success':
-      case 'completed':
-        return 'text-green-600 bg-green-50';
-      case 'failed':
-      case 'error':
-        return 'text-red-600 bg-red-50';
-      case 'pending':
-      case 'running':
-        return 'text-yellow-600 bg-yellow-50';
-      default:
-        return 'text-gray-600 bg-gray-50';
-    }
-  };
+  const statusColor =
+    TOOL_STATUS_COLORS[tool.status.toLowerCase()] ?? DEFAULT_TOOL_STATUS_COLOR;
 
   return (
     <div className="border border-gray-200 rounded-lg p-3 bg-white">
@@ -264,7 +248,7 @@ function ToolInvocationComponent({
                 🔧 {tool.toolName}
               </span>
               <span
-                className={`px-2 py-1 text-xs rounded-full ${getStatusColor(tool.status)}`}
+                className={`px-2 py-1 text-xs rounded-full ${statusColor}`}
               >
                 {tool.status}
               </span>
@@ -2,15 +2,23 @@
  * Authentication hook using MSAL React.
  */
 
-import { useEffect, useState, useCallback } from 'react';
+import { useEffect, useState, useCallback, useRef } from 'react';
 import { useMsal, useAccount } from '@azure/msal-react';
 import { InteractionStatus, SilentRequest } from '@azure/msal-browser';
 import { getLoginRequest, getTokenRequest } from '@/lib/auth-config';
-import { trackAuthEvent } from '@/lib/telemetry';
+import {
+  trackAuthEvent,
+  setAuthenticatedUserContext,
+  clearAuthenticatedUserContext,
+} from '@/lib/telemetry';
 import { apiClient } from '@/services/api-client';
 import { MfaHandler } from '@/services/mfa-handler';
 import type { User, AuthState } from '@/types';
 
+// Treat tokens this close to expiry as expired so they aren't sent only to be
+// rejected by the backend
+const TOKEN_EXPIRY_SKEW_MS = 5 * 60 * 1000;
+
 export function useAuth() {
   const { instance, accounts, inProgress } = useMsal();
   const account = useAccount(accounts[0] || {});
@@ -22,6 +30,8 @@ export function useAuth() {
     error: null,
     isLoading: true,
   });
+  // Expiry of the last access token acquired, or null when MSAL didn't report one
+  const accessTokenExpiresAtRef = useRef<number | null>(null);
 
   /**
    * Extract user information from account
@@ -51,6 +61,9 @@ export function useAuth() {
       };
 
       const response = await instance.acquireTokenSilent(request);
+      accessTokenExpiresAtRef.current = response.expiresOn
+        ? response.expiresOn.getTime()
+        : null;
       return response.accessToken;
     } catch (error) {
       console.error('Silent token acquisition failed:', error);
@@ -168,13 +181,22 @@ export function useAuth() {
       return null;
     }
 
-    // Try to use cached token first
-    if (authState.accessToken) {
+    // Use the cached token unless it has expired, checked locally from the
+    // expiry MSAL reported instead of waiting for the backend to reject it
+    const expiresAt = accessTokenExpiresAtRef.current;
+    if (
+      authState.accessToken &&
+      (expiresAt === null || Date.now() < expiresAt - TOKEN_EXPIRY_SKEW_MS)
+    ) {
       return authState.accessToken;
     }
 
     // Acquire new token silently
-    return await acquireTokenSilently();
+    const token = await acquireTokenSilently();
+    if (token) {
+      setAuthState((prev) => ({ ...prev, accessToken: token }));
+    }
+    return token;
   };
 
   // Effect to handle authentication state changes
@@ -187,10 +209,12 @@ export function useAuth() {
       if (account) {
         // User is authenticated
         const user = extractUserInfo(account);
-        const accessToken = await acquireTokenSilently();
-
-        // Use backend API token specifically for API client (split token approach)
-        const backendApiToken = await acquireBackendApiTokenSilently();
+        // Both tokens are independent, so acquire them concurrently.
+        // The backend API token is used specifically for the API client (split token approach)
+        const [accessToken, backendApiToken] = await Promise.all([
+          acquireTokenSilently(),
+          acquireBackendApiTokenSilently(),
+        ]);
 
         if (backendApiToken) {
           apiClient.setBackendApiToken(backendApiToken);
@@ -206,6 +230,12 @@ export function useAuth() {
         });
         apiClient.setMfaHandler(mfaHandler);
 
+        // Attribute telemetry to the user once here rather than passing the
+        // user ID with every tracked event
+        if (user) {
+          setAuthenticatedUserContext(user.id);
+        }
+
         setAuthState({
           isAuthenticated: true,
           user,
@@ -216,6 +246,7 @@ export function useAuth() {
       } else {
         // User is not authenticated
         apiClient.setBackendApiToken(null);
+        clearAuthenticatedUserContext();
         setAuthState({
           isAuthenticated: false,
           user: null,
@@ -242,10 +273,11 @@ export function useAuth() {
     }
 
     const refreshToken = async () => {
-      const newToken = await acquireTokenSilently();
-
       // Use backend API token specifically for API client (split token approach)
-      const newBackendApiToken = await acquireBackendApiTokenSilently();
+      const [newToken, newBackendApiToken] = await Promise.all([
+        acquireTokenSilently(),
+        acquireBackendApiTokenSilently(),
+      ]);
 
       if (newBackendApiToken && newBackendApiToken !== authState.accessToken) {
         apiClient.setBackendApiToken(newBackendApiToken);
@@ -2,12 +2,49 @@
  * Chat hook for managing chat state and interactions.
  */
 
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useRef } from 'react';
 import { v4 as uuidv4 } from 'uuid';
 import { apiClient } from '@/services/api-client';
 import { trackChatMessage, trackEvent } from '@/lib/telemetry';
 import type { ChatMessage, ChatState } from '@/types';
 
+// Acknowledgements that need no model round-trip to answer
+const LOW_SIGNAL_MESSAGES = new Set([
+  'thanks',
+  'thank you',
+  'thanks a lot',
+  'thank you very much',
+  'thx',
+  'ty',
+  'cheers',
+  'appreciated',
+  'much appreciated',
+]);
+
+const LOW_SIGNAL_REPLY =
+  "You're welcome! Let me know if there's anything else I can help with.";
+
+/**
+ * Check whether a message is a bare acknowledgement that can be answered locally
+ */
+export function isLowSignalMessage(content: string): boolean {
+  const normalized = content
+    .toLowerCase()
+    .replace(/[!.\s]+$/, '')
+    .trim();
+  return LOW_SIGNAL_MESSAGES.has(normalized);
+}
+
+interface PendingMessage {
+  content: string;
+  resolve: (success: boolean) => void;
+}
+
+interface SentMessage {
+  content: string;
+  reply: Promise<boolean>;
+}
+
 export function useChat() {
   const [chatState, setChatState] = useState<ChatState>(() => ({
     messages: [],
@@ -15,6 +52,11 @@ export function useChat() {
     error: null,
     conversationId: uuidv4(),
   }));
+  const requestInFlightRef = useRef(false);
+  const pendingMessagesRef = useRef<PendingMessage[]>([]);
+  const lastSentMessageRef = useRef<SentMessage | null>(null);
+  // Bumped on every clear so replies to the previous conversation are dropped
+  const chatGenerationRef = useRef(0);
 
   /**
    * Add a message to the chat
@@ -42,45 +84,95 @@ export function useChat() {
    */
   const updateMessage = useCallback(
     (messageId: string, updates: Partial<ChatMessage>) => {
-      setChatState((prev) => ({
-        ...prev,
-        messages: prev.messages.map((msg) =>
-          msg.id === messageId ? { ...msg, ...updates } : msg
-        ),
-      }));
+      setChatState((prev) => {
+        // Streamed chunks update the newest message, so search from the end
+        // and copy only the message that changed rather than remapping all
+        const index = prev.messages.findLastIndex(
+          (msg) => msg.id === messageId
+        );
+        if (index === -1) {
+          return prev;
+        }
+
+        const messages = prev.messages.slice();
+        messages[index] = { ...messages[index], ...updates };
+        return { ...prev, messages };
+      });
     },
     []
   );
 
   /**
-   * Send a message to the backend
+   * Request an assistant reply for a message that is already shown in the chat
    */
-  const sendMessage = useCallback(
+  const requestReply = useCallback(
     async (content: string): Promise<boolean> => {
-      if (!content.trim()) {
-        return false;
-      }
+      const generation = chatGenerationRef.current;
+      const isStale = () => chatGenerationRef.current !== generation;
 
-      setChatState((prev) => ({ ...prev, isLoading: true, error: null }));
+      // Show the assistant reply as it streams in, then finalize it below
+      let streamedMessageId: string | null = null;
+      let streamedContent = '';
 
-      try {
-        // Add user message
+      const failReply = (errorMessage: string): boolean => {
+        const partialMessageId = streamedMessageId;
+        setChatState((prev) => ({
+          ...prev,
+          // Drop the partially streamed reply; the error message replaces it
+          messages: partialMessageId
+            ? prev.messages.filter((msg) => msg.id !== partialMessageId)
+            : prev.messages,
+          error: errorMessage,
+          isLoading: false,
+        }));
+
+        // Add error message to chat
         addMessage({
-          content: content.trim(),
-          role: 'user',
+          content: `Sorry, I encountered an error: ${errorMessage}`,
+          role: 'assistant',
           timestamp: new Date(),
           conversationId: chatState.conversationId,
         });
 
+        return false;
+      };
+
+      setChatState((prev) => ({ ...prev, isLoading: true, error: null }));
+
+      try {
         // Send to backend with the session's conversationId
-        const response = await apiClient.sendMessage({
-          message: content.trim(),
-          conversationId: chatState.conversationId,
-        });
+        const response = await apiClient.streamMessage(
+          {
+            message: content,
+            conversationId: chatState.conversationId,
+          },
+          (chunk) => {
+            if (isStale()) {
+              return;
+            }
+
+            streamedContent += chunk;
+            if (streamedMessageId) {
+              updateMessage(streamedMessageId, { content: streamedContent });
+            } else {
+              streamedMessageId = addMessage({
+                content: streamedContent,
+                role: 'assistant',
+                timestamp: new Date(),
+                conversationId: chatState.conversationId,
+                format: 'markdown',
+              });
+            }
+          }
+        );
+
+        // The chat was cleared while waiting; the reply belongs to the old conversation
+        if (isStale()) {
+          return false;
+        }
 
         if (response.success && response.data) {
-          // Add assistant response
-          addMessage({
+          const assistantMessage: Omit<ChatMessage, 'id'> = {
             content: response.data.message,
             role: 'assistant',
             timestamp: new Date(response.data.timestamp),
@@ -89,55 +181,133 @@ export function useChat() {
             suggestions: response.data.suggestions,
             thoughtProcessId: response.data.thoughtProcessId,
             format: (response.data.format as 'markdown' | 'text') || 'markdown', // Use format from backend, default to markdown
-          });
+          };
+
+          // Add assistant response, or complete the one already streamed
+          if (streamedMessageId) {
+            updateMessage(streamedMessageId, assistantMessage);
+          } else {
+            addMessage(assistantMessage);
+          }
 
           setChatState((prev) => ({ ...prev, isLoading: false }));
           return true;
         } else {
           // Handle error
-          const errorMessage = response.error || 'Failed to send message';
-          setChatState((prev) => ({
-            ...prev,
-            error: errorMessage,
-            isLoading: false,
-          }));
+          return failReply(response.error || 'Failed to send message');
+        }
+      } catch (error: any) {
+        if (isStale()) {
+          return false;
+        }
 
-          // Add error message to chat
-          addMessage({
-            content: `Sorry, I encountered an error: ${errorMessage}`,
-            role: 'assistant',
-            timestamp: new Date(),
-            conversationId: chatState.conversationId,
-          });
+        return failReply(error.message || 'An unexpected error occurred');
+      }
+    },
+    [addMessage, updateMessage, chatState.conversationId]
+  );
 
-          return false;
+  /**
+   * Send messages queued during the last round-trip as a single request
+   */
+  const flushPendingMessages = useCallback(
+    async (generation: number) => {
+      // A clear has already reset the queue and in-flight state for the new chat
+      if (chatGenerationRef.current !== generation) {
+        return;
+      }
+
+      let queued = pendingMessagesRef.current.splice(0);
+
+      while (queued.length > 0) {
+        const success = await requestReply(
+          queued.map((pending) => pending.content).join('\n\n')
+        );
+        queued.forEach((pending) => pending.resolve(success));
+        if (chatGenerationRef.current !== generation) {
+          return;
         }
-      } catch (error: any) {
-        const errorMessage = error.message || 'An unexpected error occurred';
-        setChatState((prev) => ({
-          ...prev,
-          error: errorMessage,
-          isLoading: false,
-        }));
+        queued = pendingMessagesRef.current.splice(0);
+      }
 
-        // Add error message to chat
+      requestInFlightRef.current = false;
+      lastSentMessageRef.current = null;
+    },
+    [requestReply]
+  );
+
+  /**
+   * Send a message to the backend
+   */
+  const sendMessage = useCallback(
+    async (content: string): Promise<boolean> => {
+      const message = content.trim();
+      if (!message) {
+        return false;
+      }
+
+      // A repeat of the message still awaiting its reply is a double submit;
+      // share the pending reply instead of sending it again
+      const lastSent = lastSentMessageRef.current;
+      if (requestInFlightRef.current && lastSent?.content === message) {
+        return lastSent.reply;
+      }
+
+      // Add user message
+      addMessage({
+        content: message,
+        role: 'user',
+        timestamp: new Date(),
+        conversationId: chatState.conversationId,
+      });
+
+      // Answer bare acknowledgements locally instead of calling the backend.
+      // While a reply is still arriving, queue them instead so the canned
+      // answer can't land above or between chunks of the real one
+      if (!requestInFlightRef.current && isLowSignalMessage(message)) {
         addMessage({
-          content: `Sorry, I encountered an error: ${errorMessage}`,
+          content: LOW_SIGNAL_REPLY,
           role: 'assistant',
           timestamp: new Date(),
           conversationId: chatState.conversationId,
+          format: 'text',
         });
+        return true;
+      }
 
-        return false;
+      // While a reply is pending, coalesce further sends into the next request
+      if (requestInFlightRef.current) {
+        const reply = new Promise<boolean>((resolve) => {
+          pendingMessagesRef.current.push({ content: message, resolve });
+        });
+        lastSentMessageRef.current = { content: message, reply };
+        return reply;
       }
+
+      const generation = chatGenerationRef.current;
+      requestInFlightRef.current = true;
+      const reply = requestReply(message);
+      lastSentMessageRef.current = { content: message, reply };
+      const success = await reply;
+      void flushPendingMessages(generation);
+
+      return success;
     },
-    [addMessage, chatState.conversationId]
+    [addMessage, chatState.conversationId, requestReply, flushPendingMessages]
   );
 
   /**
    * Clear the chat
    */
   const clearChat = useCallback(() => {
+    // Drop messages still waiting on the previous conversation's reply
+    pendingMessagesRef.current
+      .splice(0)
+      .forEach((pending) => pending.resolve(false));
+    lastSentMessageRef.current = null;
+    requestInFlightRef.current = false;
+    chatGenerationRef.current += 1;
+
     setChatState({
       messages: [],
       isLoading: false,
@@ -231,6 +401,3 @@ export function useChat() {
     updateMessage,
   };
 }
-
-// Install uuid dependency
-// Note: We'll need to install this later: npm install uuid @types/uuid
@@ -37,6 +37,52 @@ interface ConfigError {
   details: string;
 }
 
+type ClientConfigResult =
+  | { config: ClientConfig; error: null }
+  | { config: null; error: ConfigError };
+
+// Request shared by every caller that asks for the config before it arrives
+let clientConfigRequest: Promise<ClientConfigResult> | null = null;
+
+async function requestClientConfig(): Promise<ClientConfigResult> {
+  try {
+    const response = await fetch('/api/clientConfig');
+
+    if (!response.ok) {
+      const errorData = await response.json();
+      return { config: null, error: errorData };
+    }
+
+    const configData = await response.json();
+    // Cache the config immediately when loaded so other components can access it
+    setCachedClientConfig(configData);
+    return { config: configData, error: null };
+  } catch (err) {
+    return {
+      config: null,
+      error: {
+        error: 'Network Error',
+        message: 'Failed to load client configuration',
+        details: err instanceof Error ? err.message : 'Unknown network error',
+      },
+    };
+  }
+}
+
+/**
+ * Fetch client configuration from /api/clientConfig
+ * Concurrent callers share a single request; failures are not cached so a
+ * later call can retry
+ */
+export function fetchClientConfig(): Promise<ClientConfigResult> {
+  if (!clientConfigRequest) {
+    clientConfigRequest = requestClientConfig().finally(() => {
+      clientConfigRequest = null;
+    });
+  }
+  return clientConfigRequest;
+}
+
 interface UseClientConfigResult {
   config: ClientConfig | null;
   loading: boolean;
@@ -44,37 +90,37 @@ interface UseClientConfigResult {
 }
 
 export function useClientConfig(): UseClientConfigResult {
-  const [config, setConfig] = useState<ClientConfig | null>(null);
-  const [loading, setLoading] = useState(true);
+  // Client config only changes with the server environment, so reuse the
+  // cached copy instead of refetching on every mount
+  const [config, setConfig] = useState<ClientConfig | null>(
+    getCachedClientConfig
+  );
+  const [loading, setLoading] = useState(() => !getCachedClientConfig());
   const [error, setError] = useState<ConfigError | null>(null);
 
   useEffect(() => {
-    async function loadClientConfig() {
-      try {
-        const response = await fetch('/api/clientConfig');
-
-        if (!response.ok) {
-          const errorData = await response.json();
-          setError(errorData);
-          return;
-        }
-
-        const configData = await response.json();
-        setConfig(configData);
-        // Cache the config immediately when loaded so other components can access it
-        setCachedClientConfig(configData);
-      } catch (err) {
-        setError({
-          error: 'Network Error',
-          message: 'Failed to load client configuration',
-          details: err instanceof Error ? err.message : 'Unknown network error',
-        });
-      } finally {
-        setLoading(false);
-      }
+    if (getCachedClientConfig()) {
+      return;
     }
 
-    loadClientConfig();
+    let cancelled = false;
+
+    fetchClientConfig().then((result) => {
+      if (cancelled) {
+        return;
+      }
+
+      if (result.config) {
+        setConfig(result.config);
+      } else {
+        setError(result.error);
+      }
+      setLoading(false);
+    });
+
+    return () => {
+      cancelled = true;
+    };
   }, []);
 
   return { config, loading, error };
@@ -99,4 +145,5 @@ export function setCachedClientConfig(config: ClientConfig): void {
  */
 export function clearCachedClientConfig(): void {
   cachedClientConfig = null;
+  clientConfigRequest = null;
 }
@@ -8,41 +8,24 @@ import {
   PopupRequest,
   SilentRequest,
 } from '@azure/msal-browser';
-import { ClientConfig, getCachedClientConfig } from '@/hooks/use-client-config';
+import {
+  ClientConfig,
+  fetchClientConfig,
+  getCachedClientConfig,
+} from '@/hooks/use-client-config';
 
 /**
  * Get MSAL configuration from client config API
  */
 async function getMsalConfigFromApi(): Promise<Configuration> {
-  try {
-    const response = await fetch('/api/clientConfig');
-    if (!response.ok) {
-      throw new Error(
-        `Failed to load client configuration: ${response.status}`
-      );
-    }
-
-    const config = await response.json();
-
-    if (config.error) {
-      throw new Error(config.message || 'Configuration error');
-    }
+  const result = await fetchClientConfig();
 
-    return {
-      auth: {
-        clientId: config.azure.clientId,
-        authority: config.azure.authority,
-        redirectUri: config.azure.redirectUri,
-      },
-      cache: {
-        cacheLocation: 'sessionStorage',
-        storeAuthStateInCookie: false,
-      },
-    };
-  } catch (error) {
-    console.error('Failed to load MSAL config from API:', error);
-    throw error;
+  if (!result.config) {
+    console.error('Failed to load MSAL config from API:', result.error);
+    throw new Error(result.error.message || 'Configuration error');
   }
+
+  return createMsalConfigFromClientConfig(result.config);
 }
 
 /**
@@ -177,14 +160,26 @@ function getScopes(): string[] {
   return basicScopes;
 }
 
+const OIDC_SCOPES: readonly string[] = Object.freeze([
+  'openid',
+  'profile',
+  'User.Read',
+  'email',
+]);
+
+// Backend scopes filtered from the last client config scopes array seen.
+// The client config is loaded once, so the filter only runs when it changes.
+let backendScopesSource: string[] | null = null;
+let backendScopesCache: readonly string[] = [];
+
 /**
  * Get OIDC profile scopes only (for profile information)
  * This separates profile scopes from backend API scopes as requested in issue #232
  */
 function getOidcScopes(): string[] {
-  const oidcScopes = ['openid', 'profile', 'User.Read', 'email'];
-  console.debug('Using OIDC profile scopes:', oidcScopes);
-  return oidcScopes;
+  console.debug('Using OIDC profile scopes:', OIDC_SCOPES);
+  // Copy so request objects never share the module's array
+  return [...OIDC_SCOPES];
 }
 
 /**
@@ -195,14 +190,21 @@ function getBackendApiScopes(): string[] {
   const clientConfig = getCachedClientConfig();
 
   if (clientConfig?.azure.scopes) {
-    // Filter for backend API scopes - look for scopes that match api://*/pattern
-    const backendScopes = clientConfig.azure.scopes.filter(
-      (scope) => scope.startsWith('api://') && scope.includes('/Api.')
-    );
+    if (clientConfig.azure.scopes !== backendScopesSource) {
+      // Filter for backend API scopes - look for scopes that match api://*/pattern
+      backendScopesCache = Object.freeze(
+        clientConfig.azure.scopes.filter(
+          (scope) => scope.startsWith('api://') && scope.includes('/Api.')
+        )
+      );
+      backendScopesSource = clientConfig.azure.scopes;
+    }
+    const backendScopes = backendScopesCache;
 
     if (backendScopes.length > 0) {
       console.debug('Using backend API scopes:', backendScopes);
-      return backendScopes;
+      // Copy so request objects never share the cached array
+      return [...backendScopes];
     }
   }
 
@@ -44,6 +44,56 @@ function isUsingPlaceholders(): boolean {
   );
 }
 
+/**
+ * Build the configuration object from environment variables.
+ * Azure identity values are passed in so the build-time path can substitute placeholders.
+ */
+function buildConfig(
+  tenantId: string,
+  clientId: string,
+  authority: string
+): Config {
+  const backendUrl =
+    process.env.NEXT_PUBLIC_BACKEND_URL || 'http://localhost:8000';
+  const frontendUrl =
+    process.env.NEXT_PUBLIC_FRONTEND_URL || 'http://localhost:3000';
+
+  return {
+    backendUrl,
+    frontendUrl,
+    environment: process.env.NEXT_PUBLIC_ENVIRONMENT || 'development',
+    debug: process.env.NEXT_PUBLIC_DEBUG === 'true',
+    api: {
+      baseUrl: backendUrl.endsWith('/api') ? backendUrl : `${backendUrl}/api`,
+    },
+    azure: {
+      tenantId,
+      clientId,
+      authority,
+      redirectUri:
+        process.env.NEXT_PUBLIC_AZURE_REDIRECT_URI ||
+        `${frontendUrl}/auth/callback`,
+      scopes: (
+        process.env.NEXT_PUBLIC_AZURE_SCOPES || 'openid,profile,User.Read'
+      )
+        .split(',')
+        .map((scope) => scope.trim()),
+    },
+    telemetry: {
+      connectionString:
+        process.env.NEXT_PUBLIC_APPLICATIONINSIGHTS_CONNECTION_STRING || '',
+      enabled: process.env.NEXT_PUBLIC_ENABLE_TELEMETRY === 'true',
+    },
+    security: {
+      sessionTimeout: parseInt(
+        process.env.NEXT_PUBLIC_SESSION_TIMEOUT || '3600',
+        10
+      ),
+      requireHttps: process.env.NEXT_PUBLIC_REQUIRE_HTTPS === 'true',
+    },
+  };
+}
+
 export const loadConfig = (): Config => {
   // Return cached instance if available
   if (configInstance) {
@@ -58,46 +108,11 @@ export const loadConfig = (): Config => {
 
   if (isBuildTime) {
     // Provide placeholder values during build to allow static generation
-    configInstance = {
-      backendUrl:
-        process.env.NEXT_PUBLIC_BACKEND_URL || 'http://localhost:8000',
-      frontendUrl:
-        process.env.NEXT_PUBLIC_FRONTEND_URL || 'http://localhost:3000',
-      environment: process.env.NEXT_PUBLIC_ENVIRONMENT || 'development',
-      debug: process.env.NEXT_PUBLIC_DEBUG === 'true',
-      api: {
-        baseUrl: (() => {
-          const url =
-            process.env.NEXT_PUBLIC_BACKEND_URL || 'http://localhost:8000';
-          return url.endsWith('/api') ? url : `${url}/api`;
-        })(),
-      },
-      azure: {
-        tenantId: 'build-time-placeholder',
-        clientId: 'build-time-placeholder',
-        authority: 'https://login.microsoftonline.com/build-time-placeholder',
-        redirectUri:
-          process.env.NEXT_PUBLIC_AZURE_REDIRECT_URI ||
-          `${process.env.NEXT_PUBLIC_FRONTEND_URL || 'http://localhost:3000'}/auth/callback`,
-        scopes: (
-          process.env.NEXT_PUBLIC_AZURE_SCOPES || 'openid,profile,User.Read'
-        )
-          .split(',')
-          .map((scope) => scope.trim()),
-      },
-      telemetry: {
-        connectionString:
-          process.env.NEXT_PUBLIC_APPLICATIONINSIGHTS_CONNECTION_STRING || '',
-        enabled: process.env.NEXT_PUBLIC_ENABLE_TELEMETRY === 'true',
-      },
-      security: {
-        sessionTimeout: parseInt(
-          process.env.NEXT_PUBLIC_SESSION_TIMEOUT || '3600',
-          10
-        ),
-        requireHttps: process.env.NEXT_PUBLIC_REQUIRE_HTTPS === 'true',
-      },
-    };
+    configInstance = buildConfig(
+      'build-time-placeholder',
+      'build-time-placeholder',
+      'https://login.microsoftonline.com/build-time-placeholder'
+    );
     return configInstance;
   }
 
@@ -120,47 +135,12 @@ export const loadConfig = (): Config => {
     }
   }
 
-  configInstance = {
-    backendUrl: process.env.NEXT_PUBLIC_BACKEND_URL || 'http://localhost:8000',
-    frontendUrl:
-      process.env.NEXT_PUBLIC_FRONTEND_URL || 'http://localhost:3000',
-    environment: process.env.NEXT_PUBLIC_ENVIRONMENT || 'development',
-    debug: process.env.NEXT_PUBLIC_DEBUG === 'true',
-    api: {
-      baseUrl: (() => {
-        const url =
-          process.env.NEXT_PUBLIC_BACKEND_URL || 'http://localhost:8000';
-        return url.endsWith('/api') ? url : `${url}/api`;
-      })(),
-    },
-    azure: {
-      tenantId: process.env.NEXT_PUBLIC_AZURE_TENANT_ID || '',
-      clientId: process.env.NEXT_PUBLIC_AZURE_CLIENT_ID || '',
-      authority:
-        process.env.NEXT_PUBLIC_AZURE_AUTHORITY ||
-        `https://login.microsoftonline.com/${process.env.NEXT_PUBLIC_AZURE_TENANT_ID}`,
-      redirectUri:
-        process.env.NEXT_PUBLIC_AZURE_REDIRECT_URI ||
-        `${process.env.NEXT_PUBLIC_FRONTEND_URL || 'http://localhost:3000'}/auth/callback`,
-      scopes: (
-        process.env.NEXT_PUBLIC_AZURE_SCOPES || 'openid,profile,User.Read'
-      )
-        .split(',')
-        .map((scope) => scope.trim()),
-    },
-    telemetry: {
-      connectionString:
-        process.env.NEXT_PUBLIC_APPLICATIONINSIGHTS_CONNECTION_STRING || '',
-      enabled: process.env.NEXT_PUBLIC_ENABLE_TELEMETRY === 'true',
-    },
-    security: {
-      sessionTimeout: parseInt(
-        process.env.NEXT_PUBLIC_SESSION_TIMEOUT || '3600',
-        10
-      ),
-      requireHttps: process.env.NEXT_PUBLIC_REQUIRE_HTTPS === 'true',
-    },
-  };
+  configInstance = buildConfig(
+    process.env.NEXT_PUBLIC_AZURE_TENANT_ID || '',
+    process.env.NEXT_PUBLIC_AZURE_CLIENT_ID || '',
+    process.env.NEXT_PUBLIC_AZURE_AUTHORITY ||
+      `https://login.microsoftonline.com/${process.env.NEXT_PUBLIC_AZURE_TENANT_ID}`
+  );
 
   return configInstance;
 };
@@ -20,15 +20,33 @@ declare global {
   }
 }
 
+// Telemetry is buffered and sent in batches, at most this long after the first
+// queued item, so per-call tracking only appends to an in-memory queue
+const TELEMETRY_BATCH_INTERVAL_MS = 5000;
+
+// Every telemetry type shares one in-memory queue. Batches normally keep it
+// short, but while sends are failing (e.g. offline) items pile up, so cap it
+// well below the SDK's 10,000 item default; items past the cap are dropped
+const TELEMETRY_QUEUE_LIMIT = 2000;
+
+// Severity level of exceptions that may end the session, sent without waiting
+// for the next batch (SeverityLevel.Critical)
+const CRITICAL_SEVERITY_LEVEL = 4;
+
 // Global instance of Application Insights
 let appInsights: ApplicationInsights | null = null;
 
+// Whether the loaded client config has already been checked, so disabled or
+// failed telemetry isn't re-evaluated (and re-warned about) on every call
+let telemetryResolved = false;
+
 /**
  * Reset the Application Insights instance (for testing purposes)
  * @internal
  */
 export const _resetTelemetry = (): void => {
   appInsights = null;
+  telemetryResolved = false;
 };
 
 /**
@@ -39,13 +57,18 @@ const getAppInsights = (): ApplicationInsights | null => {
     return null;
   }
 
-  if (appInsights) {
+  if (appInsights || telemetryResolved) {
     return appInsights;
   }
 
   // Get configuration from window object (set by ClientLayout)
   const config = window.__CLIENT_CONFIG__;
 
+  // Until ClientLayout has set the config, check again on the next call
+  if (config) {
+    telemetryResolved = true;
+  }
+
   if (!config?.telemetry?.connectionString || !config?.telemetry?.enabled) {
     console.warn('Application Insights is not configured or not enabled');
     return null;
@@ -64,6 +87,8 @@ const getAppInsights = (): ApplicationInsights | null => {
         disableAjaxTracking: false,
         autoTrackPageVisitTime: true,
         enableDebug: config.debug || false,
+        maxBatchInterval: TELEMETRY_BATCH_INTERVAL_MS,
+        eventsLimitInMem: TELEMETRY_QUEUE_LIMIT,
       },
     });
 
@@ -89,6 +114,12 @@ export const initializeTelemetry = (): void => {
   }
 };
 
+/**
+ * Whether telemetry is configured and running, so callers can skip building
+ * tracking data that would only be discarded
+ */
+export const isTelemetryEnabled = (): boolean => getAppInsights() !== null;
+
 /**
  * Track a page view
  */
@@ -165,6 +196,9 @@ export const trackException = (
       properties,
       severityLevel,
     });
+    if (severityLevel === CRITICAL_SEVERITY_LEVEL) {
+      ai.flush();
+    }
   } else {
     // Fallback to console if AI is not available
     console.error('Exception:', error, properties);
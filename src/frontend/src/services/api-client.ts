@@ -5,7 +5,11 @@
 
 import axios, { AxiosInstance, AxiosRequestConfig, AxiosResponse } from 'axios';
 import { getCachedClientConfig } from '@/hooks/use-client-config';
-import { trackApiCall, trackException } from '@/lib/telemetry';
+import {
+  isTelemetryEnabled,
+  trackApiCall,
+  trackException,
+} from '@/lib/telemetry';
 import { MfaHandler, MfaHandlerOptions } from '@/services/mfa-handler';
 import type {
   ApiResponse,
@@ -23,16 +27,21 @@ declare module 'axios' {
   }
 }
 
+// Applies to buffered requests, and to each wait for the next part of a
+// streamed reply so long generations that keep producing output aren't cut off
+const REQUEST_TIMEOUT_MS = 30000;
+
 export class ApiClient {
   private client: AxiosInstance;
-  private accessToken: string | null = null;
+  // Authorization header value, built once per token rather than per request
+  private authorizationHeader: string | null = null;
   private mfaHandler: MfaHandler | null = null;
 
   constructor() {
     // Initialize axios client with a placeholder URL
     // The actual baseURL will be set lazily when first request is made
     this.client = axios.create({
-      timeout: 30000,
+      timeout: REQUEST_TIMEOUT_MS,
       headers: {
         'Content-Type': 'application/json',
       },
@@ -43,17 +52,11 @@ export class ApiClient {
       (config) => {
         // Lazily set the baseURL if not already set
         if (!config.baseURL) {
-          const clientConfig = getCachedClientConfig();
-          if (clientConfig) {
-            config.baseURL = clientConfig.backend.url;
-          } else {
-            // Fallback for when config isn't loaded yet
-            config.baseURL = 'http://localhost:8000';
-          }
+          config.baseURL = this.getBaseUrl();
         }
 
-        if (this.accessToken) {
-          config.headers.Authorization = `Bearer ${this.accessToken}`;
+        if (this.authorizationHeader) {
+          config.headers.Authorization = this.authorizationHeader;
         }
         return config;
       },
@@ -66,32 +69,38 @@ export class ApiClient {
     this.client.interceptors.response.use(
       (response: AxiosResponse) => {
         // Track successful API calls
-        const startTime = response.config.metadata?.startTime || Date.now();
-        const duration = Date.now() - startTime;
-
-        trackApiCall(
-          response.config.method?.toUpperCase() || 'GET',
-          response.config.url || '',
-          response.status,
-          duration,
-          true
-        );
+        if (isTelemetryEnabled()) {
+          const startTime = response.config.metadata?.startTime;
+          const duration =
+            startTime === undefined ? 0 : performance.now() - startTime;
+
+          trackApiCall(
+            response.config.method?.toUpperCase() || 'GET',
+            response.config.url || '',
+            response.status,
+            duration,
+            true
+          );
+        }
 
         return response;
       },
       async (error) => {
         // Track failed API calls
         const response = error.response;
-        const startTime = error.config?.metadata?.startTime || Date.now();
-        const duration = Date.now() - startTime;
-
-        trackApiCall(
-          error.config?.method?.toUpperCase() || 'GET',
-          error.config?.url || '',
-          response?.status || 0,
-          duration,
-          false
-        );
+        if (isTelemetryEnabled()) {
+          const startTime = error.config?.metadata?.startTime;
+          const duration =
+            startTime === undefined ? 0 : performance.now() - startTime;
+
+          trackApiCall(
+            error.config?.method?.toUpperCase() || 'GET',
+            error.config?.url || '',
+            response?.status || 0,
+            duration,
+            false
+          );
+        }
 
         // Handle MFA challenge if we have a handler configured and it's an MFA error
         if (this.mfaHandler && this.mfaHandler.isMfaChallengeError(error)) {
@@ -106,7 +115,7 @@ export class ApiClient {
             // Clone and retry the original request with the new token
             const originalRequest = { ...error.config };
             originalRequest.headers = originalRequest.headers || {};
-            originalRequest.headers.Authorization = `Bearer ${newToken}`;
+            originalRequest.headers.Authorization = this.authorizationHeader;
 
             return this.client.request(originalRequest);
           } catch (mfaError) {
@@ -128,13 +137,25 @@ export class ApiClient {
       }
     );
 
-    // Add request timestamp for duration tracking
+    // Add request timestamp for duration tracking, from the monotonic clock so
+    // durations aren't skewed by system clock adjustments
     this.client.interceptors.request.use((config) => {
-      config.metadata = { startTime: Date.now() };
+      if (isTelemetryEnabled()) {
+        config.metadata = { startTime: performance.now() };
+      }
       return config;
     });
   }
 
+  /**
+   * Resolve the backend base URL from the loaded client config
+   */
+  private getBaseUrl(): string {
+    const clientConfig = getCachedClientConfig();
+    // Fallback for when config isn't loaded yet
+    return clientConfig ? clientConfig.backend.url : 'http://localhost:8000';
+  }
+
   /**
    * Set the MFA handler for automatic MFA challenge handling
    */
@@ -146,7 +167,7 @@ export class ApiClient {
    * Set the access token for authenticated requests
    */
   setAccessToken(token: string | null) {
-    this.accessToken = token;
+    this.authorizationHeader = token ? `Bearer ${token}` : null;
   }
 
   /**
@@ -154,7 +175,7 @@ export class ApiClient {
    * This method is specifically for backend API tokens as part of the split token approach
    */
   setBackendApiToken(token: string | null) {
-    this.accessToken = token;
+    this.setAccessToken(token);
   }
 
   /**
@@ -198,6 +219,117 @@ export class ApiClient {
     }
   }
 
+  /**
+   * Send a chat message and stream the response as it is generated.
+   * onChunk receives each piece of response text; the resolved value holds
+   * the complete response once the stream finishes.
+   */
+  async streamMessage(
+    request: ChatRequest,
+    onChunk: (chunk: string) => void
+  ): Promise<ApiResponse<ChatResponse>> {
+    const url = '/chat/message/stream';
+    const startTime = performance.now();
+    let status = 0;
+    const controller = new AbortController();
+    let timeoutId = setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS);
+
+    try {
+      const headers: Record<string, string> = {
+        'Content-Type': 'application/json',
+        Accept: 'text/event-stream',
+      };
+      if (this.authorizationHeader) {
+        headers.Authorization = this.authorizationHeader;
+      }
+
+      const response = await fetch(`${this.getBaseUrl()}${url}`, {
+        method: 'POST',
+        headers,
+        body: JSON.stringify(request),
+        signal: controller.signal,
+      });
+      status = response.status;
+
+      // MFA challenges and backends without the streaming endpoint are
+      // rejected before any processing, so retry on the buffered endpoint
+      if (response.status === 401 || response.status === 404) {
+        return this.sendMessage(request);
+      }
+
+      if (!response.ok || !response.body) {
+        const errorBody = await response.json().catch(() => null);
+        throw new Error(
+          errorBody?.error?.message ||
+            errorBody?.detail ||
+            `Request failed with status ${response.status}`
+        );
+      }
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let result: ChatResponse | undefined;
+
+      for (;;) {
+        const { done, value } = await reader.read();
+        if (done) {
+          break;
+        }
+
+        // The stream is still making progress, so restart the idle timeout
+        clearTimeout(timeoutId);
+        timeoutId = setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS);
+
+        buffer += decoder.decode(value, { stream: true });
+
+        // Server-sent events are separated by a blank line. Scan forward from
+        // an offset and drop the consumed text once per read, rather than
+        // copying the rest of the buffer after every event
+        let start = 0;
+        let boundary = buffer.indexOf('\n\n');
+        while (boundary !== -1) {
+          const event = parseServerSentEvent(buffer.slice(start, boundary));
+          start = boundary + 2;
+          boundary = buffer.indexOf('\n\n', start);
+
+          if (event.name === 'chunk') {
+            onChunk(JSON.parse(event.data));
+          } else if (event.name === 'done') {
+            result = JSON.parse(event.data);
+          } else if (event.name === 'error') {
+            throw new Error(JSON.parse(event.data));
+          }
+        }
+        buffer = buffer.slice(start);
+      }
+
+      if (!result) {
+        throw new Error('Response stream ended unexpectedly');
+      }
+
+      if (isTelemetryEnabled()) {
+        trackApiCall('POST', url, status, performance.now() - startTime, true);
+      }
+      return {
+        data: result,
+        success: true,
+      };
+    } catch (error: any) {
+      if (isTelemetryEnabled()) {
+        trackApiCall('POST', url, status, performance.now() - startTime, false);
+      }
+      return {
+        error: controller.signal.aborted
+          ? `no response for ${REQUEST_TIMEOUT_MS}ms`
+          : error.message || 'Failed to send message',
+        success: false,
+      };
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
   /**
    * Get chat history
    */
@@ -205,10 +337,13 @@ export class ApiClient {
     conversationId?: string
   ): Promise<ApiResponse<ChatResponse[]>> {
     try {
-      const params = conversationId ? { conversation_id: conversationId } : {};
-      const response = await this.client.get<ChatResponse[]>('/chat/history', {
-        params,
-      });
+      // Only build request config when there is a query parameter to send
+      const response = await this.client.get<ChatResponse[]>(
+        '/chat/history',
+        conversationId
+          ? { params: { conversation_id: conversationId } }
+          : undefined
+      );
       return {
         data: response.data,
         success: true,
@@ -295,6 +430,24 @@ export class ApiClient {
   }
 }
 
+/**
+ * Parse the event name and data lines of a single server-sent event
+ */
+function parseServerSentEvent(raw: string): { name: string; data: string } {
+  let name = 'message';
+  const data: string[] = [];
+
+  for (const line of raw.split('\n')) {
+    if (line.startsWith('event:')) {
+      name = line.slice('event:'.length).trim();
+    } else if (line.startsWith('data:')) {
+      data.push(line.slice('data:'.length).trim());
+    }
+  }
+
+  return { name, data: data.join('\n') };
+}
+
 // Global API client instance
 export const apiClient = new ApiClient();
 
@@ -19,6 +19,8 @@ export interface MfaHandlerOptions {
 export class MfaHandler {
   private msalInstance: IPublicClientApplication;
   private account: any;
+  // Challenges currently being completed, keyed by claims and scopes
+  private pendingChallenges = new Map<string, Promise<string>>();
 
   constructor(options: MfaHandlerOptions) {
     this.msalInstance = options.msalInstance;
@@ -39,8 +41,29 @@ export class MfaHandler {
   /**
    * Handles an MFA challenge by prompting the user for interactive authentication
    * with the claims challenge from the backend.
+   * Concurrent requests rejected with the same challenge share a single
+   * token acquisition instead of each forcing a refresh or opening a popup.
    */
-  public async handleMfaChallenge(
+  public handleMfaChallenge(
+    challengeDetails: MfaChallengeDetails
+  ): Promise<string> {
+    const key = `${challengeDetails.claimsChallenge}|${challengeDetails.scopes.join(' ')}`;
+    const pending = this.pendingChallenges.get(key);
+    if (pending) {
+      return pending;
+    }
+
+    const challenge = this.completeMfaChallenge(challengeDetails).finally(() =>
+      this.pendingChallenges.delete(key)
+    );
+    this.pendingChallenges.set(key, challenge);
+    return challenge;
+  }
+
+  /**
+   * Acquire a token satisfying the claims challenge, silently if possible
+   */
+  private async completeMfaChallenge(
     challengeDetails: MfaChallengeDetails
   ): Promise<string> {
     if (!this.account) {